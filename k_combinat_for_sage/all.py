@@ -19,7 +19,9 @@ REFERENCES:
 #                  http://www.gnu.org/licenses/
 #*****************************************************************************
 import sys
+from collections import OrderedDict
 
+import numpy as np
 from sage.all import *
 from sage.combinat.partition_shifting_algebras import ShiftingOperatorAlgebra as ShiftingOperatorAlgebraExplicit
 
@@ -87,6 +89,76 @@ def _is_k_schur(obj):
 
 
 # MAIN
+class SymmetricFunctionBases(object):
+    r""" The ring of symmetric functions over ``base_ring`` together with the bases used throughout this library.
+
+    Do not create these directly.  Use :meth:`symmetric_function_bases` instead, so that each pair (``base_ring``, ``t``) is only ever set up once.
+
+    Each basis is built the first time it is asked for, and then kept.
+
+    ..  SEEALSO::
+        :meth:`symmetric_function_bases`
+    """
+
+    def __init__(self, base_ring, t=None):
+        self.base_ring = base_ring
+        self.t = t
+        self.sym = SymmetricFunctions(base_ring)
+
+    def __repr__(self):
+        return 'Symmetric function bases over {} with t = {}'.format(self.base_ring, self.t)
+
+    @lazy_attribute
+    def s(self):
+        return self.sym.s()
+
+    @lazy_attribute
+    def h(self):
+        return self.sym.h()
+
+    @lazy_attribute
+    def e(self):
+        return self.sym.e()
+
+    @lazy_attribute
+    def p(self):
+        return self.sym.p()
+
+    @lazy_attribute
+    def m(self):
+        return self.sym.m()
+
+    @lazy_attribute
+    def hall_littlewood(self):
+        if self.t is None:
+            return self.sym.hall_littlewood()
+        else:
+            return self.sym.hall_littlewood(t=self.t)
+
+    @lazy_attribute
+    def Qp(self):
+        return self.hall_littlewood.Qp()
+
+
+@cached_function
+def symmetric_function_bases(base_ring=QQ['t'], t=None):
+    r""" Return the :class:`SymmetricFunctionBases` over ``base_ring`` whose Hall-Littlewood bases use the parameter ``t``.
+
+    The result is cached, so after the first call this is a dictionary lookup.  If ``t`` is ``None``, the Hall-Littlewood bases use the generator of ``base_ring``.
+
+    EXAMPLES::
+
+        sage: bases = symmetric_function_bases(QQ['t'])
+        sage: bases.s
+        Symmetric Functions over Univariate Polynomial Ring in t over Rational Field in the Schur basis
+        sage: bases.Qp
+        Symmetric Functions over Univariate Polynomial Ring in t over Rational Field in the Hall-Littlewood Qp basis
+        sage: symmetric_function_bases(QQ['t']) is bases
+        True
+    """
+    return SymmetricFunctionBases(base_ring, t)
+
+
 def get_k_rectangles(k):
     r""" Return the list of ``k``-rectangles.
 
@@ -218,6 +290,204 @@ def size_to_num_k_shapes(n, k):
     return len(size_to_k_shapes(n, k))
 
 
+class _LRUCache(object):
+    # A dictionary which forgets its least recently used entries once it holds more than ``maxsize`` of them.
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __getitem__(self, key):
+        # move the key to the most recently used end
+        value = self._data.pop(key)
+        self._data[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._data.pop(key, None)
+        self._data[key] = value
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        self._data.clear()
+
+
+# maps (basis, composition tuple) to the straightened composition.  For Schur-like bases the value is a (partition, sign) pair or None, and for the Hall-Littlewood basis it is an element.
+_straighten_cache = _LRUCache(maxsize=2**16)
+# maps the class of a basis to how that basis straightens
+_straightening_kinds = {}
+# below this many compositions of the same length, straighten_many does not bother with numpy
+_NUMPY_BATCH_THRESHOLD = 64
+
+
+def _straightening_kind(basis):
+    # Return 'schur', 'sorting' (the index is simply sorted), 'hall littlewood', 'unknown' for a symmetric function basis with no straightening rule, or None if ``basis`` is not a recognized basis.
+    basis_class = basis.__class__
+    if basis_class not in _straightening_kinds:
+        name = basis_class.__name__
+        if name in ('SymmetricFunctionAlgebra_monomial_with_category', 'SymmetricFunctionAlgebra_dual_with_category'):
+            kind = 'unknown'
+        elif name == 'HallLittlewood_qp_with_category':
+            kind = 'hall littlewood'
+        elif name in ('SymmetricFunctionAlgebra_homogeneous_with_category', 'SymmetricFunctionAlgebra_elementary_with_category', 'SymmetricFunctionAlgebra_power_with_category', 'SymmetricFunctionAlgebra_witt_with_category'):
+            kind = 'sorting'
+        elif name == 'SymmetricFunctionAlgebra_schur_with_category':
+            kind = 'schur'
+        else:
+            kind = None
+        _straightening_kinds[basis_class] = kind
+    return _straightening_kinds[basis_class]
+
+
+def _check_straightening_kind(kind):
+    # raise the appropriate error if a basis of this kind cannot be straightened
+    if kind == 'unknown':
+        raise NotImplementedError(
+            'Straightening does not exist (that i know of) for the monomial basis or the forgotten/dual basis.')
+    elif kind is None:
+        raise ValueError(
+            "The input parameter 'basis' should be a symmetric function basis.  For example, 's = SymmetricFunctions(QQ).s(); straighten(s, [2, 1, 3])', or one could use 'h' instead of 's'.")
+
+
+def _number_of_noninversions(lis):
+    # Return the number of pairs i < j with lis[i] < lis[j], by merge sort.
+    def sort_and_count(lis):
+        # return (lis sorted in decreasing order, number of noninversions in lis)
+        if len(lis) <= 1:
+            return list(lis), 0
+        middle = len(lis) // 2
+        (left, left_count) = sort_and_count(lis[:middle])
+        (right, right_count) = sort_and_count(lis[middle:])
+        merged = []
+        count = left_count + right_count
+        i = 0
+        j = 0
+        while i < len(left) and j < len(right):
+            if left[i] < right[j]:
+                # right[j] beats everything left in the left half
+                count += len(left) - i
+                merged.append(right[j])
+                j += 1
+            else:
+                merged.append(left[i])
+                i += 1
+        merged += left[i:] + right[j:]
+        return merged, count
+    return sort_and_count(list(lis))[1]
+
+
+def _straighten_index(kind, gamma):
+    # Straighten the tuple ``gamma`` for a 'schur' or 'sorting' kind of basis.  Return (partition, sign), or None if it straightens to 0.
+    if kind == 'schur':
+        rho = range(len(gamma) - 1, -1, -1)
+        combined = [g + r for g, r in zip(gamma, rho)]
+    else:
+        rho = [0] * len(gamma)
+        combined = list(gamma)
+    sorted_combined = sorted(combined, reverse=True)
+    if sorted_combined and sorted_combined[-1] < 0:
+        return None
+    if kind == 'schur':
+        if any(a == b for a, b in zip(sorted_combined, sorted_combined[1:])):
+            return None
+        sign = (-1)**_number_of_noninversions(combined)
+    else:
+        sign = 1
+    return (Partition([sc - r for sc, r in zip(sorted_combined, rho)]), sign)
+
+
+def _number_of_cycles(permutations):
+    # Return the number of cycles of each row of the 2d array ``permutations``, in O(l log l) time per row of length l.  Each position is labelled by the smallest position in its cycle by pointer doubling.
+    labels = np.broadcast_to(np.arange(permutations.shape[1]), permutations.shape).copy()
+    jumps = permutations
+    step = 1
+    while step < permutations.shape[1]:
+        labels = np.minimum(labels, np.take_along_axis(labels, jumps, axis=1))
+        jumps = np.take_along_axis(jumps, jumps, axis=1)
+        step *= 2
+    return (labels == np.arange(permutations.shape[1])).sum(axis=1)
+
+
+def _straighten_indices_numpy(kind, gammas):
+    # Same as _straighten_index applied to each tuple in ``gammas``, which must all have the same positive length.
+    array = np.array(gammas, dtype=np.int64)
+    length = array.shape[1]
+    if kind == 'schur':
+        rho = np.arange(length - 1, -1, -1, dtype=np.int64)
+        array = array + rho
+    else:
+        rho = np.zeros(length, dtype=np.int64)
+    sorted_array = np.sort(array, axis=1)[:, ::-1]
+    is_nonzero = sorted_array[:, -1] >= 0
+    if kind == 'schur':
+        is_nonzero &= np.all(sorted_array[:, :-1] != sorted_array[:, 1:], axis=1)
+        # the sign is the parity of the permutation sorting each row into decreasing order, which is the length minus its number of cycles
+        signs = 1 - 2 * ((length - _number_of_cycles(np.argsort(-array, axis=1, kind='stable'))) % 2)
+    else:
+        signs = np.ones(len(gammas), dtype=np.int64)
+    straightened = sorted_array - rho
+    partitions = {}
+    results = []
+    for row, nonzero, sign in zip(straightened.tolist(), is_nonzero.tolist(), signs.tolist()):
+        if not nonzero:
+            results.append(None)
+            continue
+        key = tuple(row)
+        if key not in partitions:
+            partitions[key] = Partition(key)
+        results.append((partitions[key], sign))
+    return results
+
+
+def _straighten_cached(basis, kind, gamma):
+    # Straighten the tuple ``gamma``, going through the cache.  See _straighten_cache for the return value.
+    key = (basis, gamma)
+    if key in _straighten_cache:
+        return _straighten_cache[key]
+    if kind == 'hall littlewood':
+        value = compositional_hall_littlewood_Qp(list(gamma), base_ring=basis.base_ring(), t=basis.t)
+    else:
+        value = _straighten_index(kind, gamma)
+    _straighten_cache[key] = value
+    return value
+
+
+def _straighten_many_indices(basis, kind, gammas):
+    # Same as _straighten_cached on each tuple in ``gammas``, but uncached compositions of the same length are handled together by numpy when there are enough of them.
+    results = [None] * len(gammas)
+    uncached_by_length = {}
+    for position, gamma in enumerate(gammas):
+        if (basis, gamma) in _straighten_cache:
+            results[position] = _straighten_cache[(basis, gamma)]
+        else:
+            uncached_by_length.setdefault(len(gamma), []).append(position)
+    if kind == 'hall littlewood':
+        # compositions sharing a suffix share work
+        positions = [position for positions in uncached_by_length.values() for position in positions]
+        values = compositional_hall_littlewood_Qp_many([gammas[position] for position in positions], base_ring=basis.base_ring(), t=basis.t)
+        for position, value in zip(positions, values):
+            _straighten_cache[(basis, gammas[position])] = value
+            results[position] = value
+        return results
+    for length, positions in uncached_by_length.items():
+        if kind in ('schur', 'sorting') and length > 0 and len(positions) >= _NUMPY_BATCH_THRESHOLD:
+            batch = [gammas[position] for position in positions]
+            for position, value in zip(positions, _straighten_indices_numpy(kind, batch)):
+                _straighten_cache[(basis, gammas[position])] = value
+                results[position] = value
+        else:
+            for position in positions:
+                results[position] = _straighten_cached(basis, kind, gammas[position])
+    return results
+
+
 def straighten(basis, gamma):
     r""" Perform Schur function straightening by the Schur straightening rule.
 
@@ -232,6 +502,8 @@ def straighten(basis, gamma):
 
     where `\rho=(\ell-1,\ell-2,\dots,0)`, `\text{sort}(\beta)` denotes the weakly decreasing sequence obtained by sorting `\beta`, and `\text{sgn}(\beta)` denotes the sign of the (shortest possible) sorting permutation.
 
+    Results are remembered (up to a bounded number of them), so straightening the same composition again is a dictionary lookup.  To straighten many compositions at once, use :meth:`straighten_many`.
+
     EXAMPLES:
 
     We know s[2, 1, 3] := -s[2, 2, 2]::
@@ -239,46 +511,70 @@ def straighten(basis, gamma):
         sage: s = SymmetricFunctions(QQ).s()
         sage: straighten(s, [2, 1, 3])
         -s[2, 2, 2]
+
+    ..  SEEALSO::
+
+        :meth:`straighten_many`
     """
-    def has_nonnegative_parts(lis):
-        return all(e >= 0 for e in lis)
-
-    def has_distinct_parts(lis):
-        return len(set(lis)) == len(lis)
-
-    def number_of_noninversions(lis):
-        num = 0
-        for i in range(len(lis)):
-            for j in range(i + 1, len(lis)):
-                # i < j is already enforced
-                if lis[i] < lis[j]:
-                    num += 1
-        return num
-    gamma = Composition(gamma)
-    if basis.__class__.__name__ in ('SymmetricFunctionAlgebra_monomial_with_category', 'SymmetricFunctionAlgebra_dual_with_category'):
-        raise NotImplemented(
-            'Straightening does not exist (that i know of) for the monomial basis or the forgotten/dual basis.')
-    elif basis.__class__.__name__ == 'HallLittlewood_qp_with_category':
-        return compositional_hall_littlewood_Qp(gamma, base_ring=basis.base_ring(), t=basis.t)
-    elif basis.__class__.__name__ in ('SymmetricFunctionAlgebra_homogeneous_with_category', 'SymmetricFunctionAlgebra_elementary_with_category', 'SymmetricFunctionAlgebra_power_with_category', 'SymmetricFunctionAlgebra_witt_with_category'):
-        new_gamma = list(reversed(sorted(gamma)))
-        if has_nonnegative_parts(new_gamma):
-            return basis(Partition(new_gamma))
-        else:
-            return 0
-    elif basis.__class__.__name__ == 'SymmetricFunctionAlgebra_schur_with_category':
-        rho = list(range(len(gamma) - 1, -1, -1))
-        combined = [g + r for g, r in zip(gamma, rho)]
-        if has_distinct_parts(combined) and has_nonnegative_parts(combined):
-            sign = (-1)**number_of_noninversions(combined)
-            sort_combined = reversed(sorted(combined))
-            new_gamma = [sc - r for sc, r in zip(sort_combined, rho)]
-            return sign * basis(Partition(new_gamma))
-        else:
-            return 0
+    kind = _straightening_kind(basis)
+    _check_straightening_kind(kind)
+    value = _straighten_cached(basis, kind, tuple(gamma))
+    if kind == 'hall littlewood':
+        return value
+    elif value is None:
+        return 0
     else:
-        raise ValueError(
-            "The input parameter 'basis' should be a symmetric function basis.  For example, 's = SymmetricFunctions(QQ).s(); straighten(s, [2, 1, 3])', or one could use 'h' instead of 's'.")
+        (partition, sign) = value
+        return basis.term(partition, sign)
+
+
+def straighten_many(basis, gammas):
+    r""" Return the list of :meth:`straighten` applied to each composition in ``gammas``.
+
+    For the Schur, homogeneous, elementary, power, and Witt bases, compositions of the same length which have not been straightened before are sorted together using numpy.
+
+    EXAMPLES::
+
+        sage: s = SymmetricFunctions(QQ).s()
+        sage: straighten_many(s, [[2, 1, 3], [1, 2], [3, 1]])
+        [-s[2, 2, 2], 0, s[3, 1]]
+
+    ..  SEEALSO::
+
+        :meth:`straighten`
+    """
+    kind = _straightening_kind(basis)
+    _check_straightening_kind(kind)
+    values = _straighten_many_indices(basis, kind, [tuple(gamma) for gamma in gammas])
+    if kind == 'hall littlewood':
+        return values
+    return [0 if value is None else basis.term(value[0], value[1]) for value in values]
+
+
+def _straighten_terms(basis, terms):
+    # Given a dictionary ``terms`` of (composition, coefficient) pairs, straighten each composition once in ``basis`` and return the linear combination as a single element of ``basis``.
+    compositions = [composition for composition, coeff in terms.items() if coeff != 0]
+    kind = _straightening_kind(basis)
+    out_terms = {}
+    if kind in ('schur', 'sorting'):
+        # no need to build an element for each composition
+        values = _straighten_many_indices(basis, kind, compositions)
+        for composition, value in zip(compositions, values):
+            if value is not None:
+                (partition, sign) = value
+                out_terms[partition] = out_terms.get(partition, 0) + sign * terms[composition]
+    else:
+        if kind == 'hall littlewood':
+            straightened_list = _straighten_many_indices(basis, kind, compositions)
+        else:
+            straightened_list = [basis(list(composition)) for composition in compositions]
+        for composition, straightened in zip(compositions, straightened_list):
+            for index, straightened_coeff in straightened.monomial_coefficients().items():
+                out_terms[index] = out_terms.get(index, 0) + terms[composition] * straightened_coeff
+    # the coefficients may come from another ring, such as the base ring of a shifting operator
+    base_ring = basis.base_ring()
+    out_terms = dict((index, base_ring(coeff)) for index, coeff in out_terms.items())
+    return basis.sum_of_terms(((index, coeff) for index, coeff in out_terms.items() if coeff != 0), distinct=True)
 
 
 class ShiftingSequenceSpace():
@@ -600,35 +896,8 @@ class ShiftingOperatorAlgebra2(CombinatorialFreeModule):
                 sage: S[2, 1](s[4, 3, 2, 1])
                 s[6, 4, 2, 1]
             """
-            def raise_func(seq, operand):
-                # seq is the index
-                if _is_sequence(operand):
-                    return self._call_basis_on_index(seq, operand)
-                else:
-                    # it's some symmetric function basis element
-                    parent_basis = operand.parent()
-                    # but does the base ring of the parent basis agree with the base ring of the operator algebra??
-                    # process the vectors
-                    dic = operand.monomial_coefficients()
-                    assert len(dic) == 1
-                    # occasionally a coefficient can show up (not cool, so consider the inclusion of coeff here a patch)
-                    (composition, coeff) = list(dic.items())[0]
-                    out_composition = raise_func(seq, composition)
-                    if parent_basis.__class__.__name__ in (
-                            'SymmetricFunctionAlgebra_homogeneous_with_category',
-                            'SymmetricFunctionAlgebra_elementary_with_category',
-                            'SymmetricFunctionAlgebra_power_with_category',
-                            'SymmetricFunctionAlgebra_witt_with_category',
-                            'SymmetricFunctionAlgebra_schur_with_category',
-                            'HallLittlewood_qp_with_category'):
-                        return coeff * straighten(parent_basis, out_composition)
-                    else:
-                        return coeff * parent_basis(out_composition)
-
-            def call_monomial(seq, coeff, operand, power=1):
-                for _ in range(power):
-                    operand = raise_func(seq, operand)
-                return (operand, coeff)
+            def call_monomial(seq, coeff, operand):
+                return (self._call_basis_on_index(seq, operand), coeff)
             # start here
             if hasattr(operand, '_get_indices_for_index_operator'):
                 indices = operand._get_indices_for_index_operator()
@@ -643,14 +912,14 @@ class ShiftingOperatorAlgebra2(CombinatorialFreeModule):
                 # the operand is some kind of composition
                 return [call_monomial(index, coeff, operand) for index, coeff in self]
             else:
-                # the operand is a symmetric function
-                if len(operand) > 1:
-                    # the operand looks like s[2, 1] + s[3], for example
-                    return sum(self.__call__(summand) for summand in operand.terms())
-                else:
-                    out_list = [call_monomial(index, coeff, operand)
-                                for index, coeff in self]
-                    return sum(coeff * mon for mon, coeff in out_list)
+                # the operand is a symmetric function, such as s[2, 1] + s[3].
+                # raise its indices formally and straighten each distinct composition only once at the end
+                terms = {}
+                for composition, operand_coeff in operand.monomial_coefficients().items():
+                    for index, coeff in self:
+                        out_composition = tuple(self._call_basis_on_index(index, composition))
+                        terms[out_composition] = terms.get(out_composition, 0) + coeff * operand_coeff
+                return _straighten_terms(operand.parent(), terms)
 
 
 class RaisingOperatorAlgebra2(ShiftingOperatorAlgebra2):
@@ -836,6 +1105,17 @@ class PieriOperatorAlgebra(ShiftingOperatorAlgebraExplicit):
                 return ShiftingOperatorAlgebra.Element.__call__(self, operand)
 
 
+# maps (base_ring, t, composition tuple) to the Hall-Littlewood vertex operator of the composition applied to 1
+_vertex_operator_cache = _LRUCache(maxsize=2**12)
+# maps (base_ring, t) to the tables of Schur functions, skewing elements, and skewed Schur functions used by HallLittlewoodVertexOperator._op
+_vertex_operator_tables = _LRUCache(maxsize=2**4)
+
+
+def _new_vertex_operator_tables():
+    # the 'hh' and 'eeq' tables are keyed by an integer k and the 'skew' table by a pair (mu, k)
+    return {'hh': _LRUCache(maxsize=2**10), 'eeq': _LRUCache(maxsize=2**10), 'skew': _LRUCache(maxsize=2**14)}
+
+
 class HallLittlewoodVertexOperator:
     r""" The Hall-Littlewood vertex operator.
 
@@ -864,8 +1144,14 @@ class HallLittlewoodVertexOperator:
         else:
             raise ValueError('Bad composition.')
         self.base_ring = base_ring
-        self.sym = SymmetricFunctions(self.base_ring)
+        self._bases = symmetric_function_bases(self.base_ring, t)
+        self.sym = self._bases.sym
         self._t = t
+        # the elements used by _op, shared by all vertex operators with the same base ring and t
+        key = (self.base_ring, self._t)
+        if key not in _vertex_operator_tables:
+            _vertex_operator_tables[key] = _new_vertex_operator_tables()
+        self._tables = _vertex_operator_tables[key]
 
     def __repr__(self):
         r""" Return a human-friendly string representation of this Hall-Littlewood vertex operator.
@@ -903,17 +1189,32 @@ class HallLittlewoodVertexOperator:
         # if k is less than 0, result is 0
         # if k == 0, result is s([])
         # if k > 0, then the result is s([k])
-        sym = self.sym
-        s = sym.s()
-        if k == 0:
-            return s.one()
-        elif k < 0:
-            # 0, but as a sym func
-            return 0 * s.one()
-        elif k > 0:
-            return s([k])
-        else:
-            raise ValueError
+        hh_table = self._tables['hh']
+        if k not in hh_table:
+            s = self._bases.s
+            if k == 0:
+                hh_table[k] = s.one()
+            elif k < 0:
+                # 0, but as a sym func
+                hh_table[k] = s.zero()
+            else:
+                hh_table[k] = s([k])
+        return hh_table[k]
+
+    def _eeq(self, k):
+        r""" Internal helper function.
+
+        Return `e_k[(1-t)X]` in the Schur basis, for a positive integer ``k``.
+        """
+        eeq_table = self._tables['eeq']
+        if k not in eeq_table:
+            e = self._bases.e
+            if self._t is None:
+                t = self.base_ring.gen()
+            else:
+                t = self._t
+            eeq_table[k] = self._bases.s(e([k]).theta_qt(t, 0))
+        return eeq_table[k]
 
     def _skewbyeeq(self, k, f):
         r""" Internal helper function.
@@ -921,31 +1222,50 @@ class HallLittlewoodVertexOperator:
         Given integer ``k`` and function ``f``, return the function `f` skewed by e[k](1-t).
         """
         # skew by e[k](1-t)
-        sym = self.sym
-        e = sym.e()
-        if self._t is None:
-            t = self.base_ring.gen()
-        else:
-            t = self._t
         if k == 0:
             return f
         elif k < 0:
             # 0, but as a sym func
             return 0 * f
         elif k > 0:
-            return f.skew_by(e([k]).theta_qt(t, 0))
+            return f.skew_by(self._eeq(k))
         else:
             raise ValueError
 
+    def _skew_basis_element(self, mu, k):
+        r""" Internal helper function.
+
+        Return the dictionary of Schur coefficients of `s_\mu` skewed by `e_k[(1-t)X]`, for `0 < k \leq |\mu|`.
+        """
+        skew_table = self._tables['skew']
+        key = (mu, k)
+        if key not in skew_table:
+            s = self._bases.s
+            skew_table[key] = dict(s(mu).skew_by(self._eeq(k)).monomial_coefficients())
+        return skew_table[key]
+
     def _op(self, m, f):
         r""" Internal helper function.
 
         This method is Jing's Hall-Littlewood creation operator.
 
+        The input is expanded in the Schur basis once.  Then a single pass over its support collects `f` skewed by `e_k[(1-t)X]` for every `k` at once, using the skews of Schur functions remembered from earlier calls.
+
         ..  SEEALSO::
             :meth:`sage.combinat.sf.new_kschur.KBoundedSubspaceBases.ElementMethods.hl_creation_operator`
         """
-        return sum((-1)**k * self._hh(m+k) * self._skewbyeeq(k, f) for k in range(f.degree() + 1))
+        s = self._bases.s
+        f_coeffs = s(f).monomial_coefficients()
+        degree = max([mu.size() for mu in f_coeffs] + [0])
+        # skewed[k] holds the Schur coefficients of f skewed by e[k](1-t).  Only k with m + k >= 0 matter.
+        skewed = [dict(f_coeffs)] + [{} for _ in range(degree)]
+        for mu, coeff in f_coeffs.items():
+            for k in range(max(1, -m), mu.size() + 1):
+                skewed_k = skewed[k]
+                for nu, skew_coeff in self._skew_basis_element(mu, k).items():
+                    skewed_k[nu] = skewed_k.get(nu, 0) + coeff * skew_coeff
+        return sum(((-1)**k * self._hh(m+k) * s._from_dict(skewed_k)
+            for k, skewed_k in enumerate(skewed) if skewed_k and m + k >= 0), s.zero())
 
     def __call__(self, input_):
         r""" Return the action of this Hall-Littlewood operator on ``input_``.
@@ -972,16 +1292,43 @@ class HallLittlewoodVertexOperator:
             :meth:`sage.combinat.sf.new_kschur.KBoundedSubspaceBases.ElementMethods.hl_creation_operator`
         """
         gamma = self.composition
-        sym = self.sym
-        if self._t is None:
-            HLQp = sym.hall_littlewood().Qp()
+        HLQp = self._bases.Qp
+        if input_.parent() is HLQp and input_ == HLQp.one():
+            # reuse whatever suffix of gamma has already been applied to 1
+            input_ = self._call_on_one(tuple(gamma))
         else:
-            HLQp = sym.hall_littlewood(t=self._t).Qp()
-        # iterate
-        for part in reversed(gamma):
-            input_ = self._op(part, input_)
+            # iterate
+            for part in reversed(gamma):
+                input_ = self._op(part, input_)
         return HLQp(input_)
 
+    def _call_on_one(self, gamma):
+        r""" Internal helper function.
+
+        Return `H_\gamma` applied to `1`, before conversion to the Q' basis.
+
+        The results for each suffix of ``gamma`` are remembered (up to a bounded number of them), so compositions which share a suffix only compute it once.
+        """
+        # H_0 acts on 1 as the identity
+        gamma = tuple(gamma)
+        while gamma and gamma[-1] == 0:
+            gamma = gamma[:-1]
+        key_prefix = (self.base_ring, self._t)
+        # find the longest suffix already computed
+        start = len(gamma)
+        f = self._bases.Qp.one()
+        for suffix_start in range(len(gamma)):
+            key = key_prefix + (gamma[suffix_start:],)
+            if key in _vertex_operator_cache:
+                start = suffix_start
+                f = _vertex_operator_cache[key]
+                break
+        # apply the rest of gamma, remembering each new suffix
+        for suffix_start in range(start - 1, -1, -1):
+            f = self._op(gamma[suffix_start], f)
+            _vertex_operator_cache[key_prefix + (gamma[suffix_start:],)] = f
+        return f
+
 
 def compositional_hall_littlewood_Qp(gamma, base_ring=QQ['t'], t=None):
     r""" Given gamma, returns the compositional Hall-Littlewood polynomial `H_{\gamma}(\mathbf{x}; t)` in the Q' basis, as defined in [cat]_ section 4.4.
@@ -997,11 +1344,7 @@ def compositional_hall_littlewood_Qp(gamma, base_ring=QQ['t'], t=None):
     ..  SEEALSO::
         :meth:`sage.combinat.sf.hall_littlewood.HallLittlewood.Qp`
     """
-    sym = SymmetricFunctions(base_ring)
-    if t is None:
-        HLQp = sym.hall_littlewood().Qp()
-    else:
-        HLQp = sym.hall_littlewood(t=t).Qp()
+    HLQp = symmetric_function_bases(base_ring, t).Qp
     if is_weakly_decreasing(gamma) and all(term > 0 for term in gamma[:-1]) and ((not gamma) or gamma[-1] >=0):
         # this is MUCH faster than the HallLittlewoodVertexOperator for partitions of length 5ish
         gamma = Partition(gamma)
@@ -1010,6 +1353,58 @@ def compositional_hall_littlewood_Qp(gamma, base_ring=QQ['t'], t=None):
         H = HallLittlewoodVertexOperator
         return H(gamma, base_ring=base_ring, t=t)(HLQp.one())
 
+
+def compositional_hall_littlewood_Qp_many(gammas, base_ring=QQ['t'], t=None):
+    r""" Return the list of :meth:`compositional_hall_littlewood_Qp` applied to each composition in ``gammas``.
+
+    The compositions which are not partitions are put in a trie keyed by their parts read from right to left, and the vertex operators are applied by walking down the trie, so a suffix shared by several compositions is only computed once.
+
+    EXAMPLES::
+
+        sage: compositional_hall_littlewood_Qp_many([[3, 3, 2], [1, 3, 2], [0, 4]])
+        [HLQp[3, 3, 2],
+         (t-1)*HLQp[2, 2, 2] + t^2*HLQp[3, 2, 1],
+         (t^2-t)*HLQp[2, 2] + (t^2-1)*HLQp[3, 1] + t*HLQp[4]]
+
+    ..  SEEALSO::
+        :meth:`compositional_hall_littlewood_Qp`
+    """
+    HLQp = symmetric_function_bases(base_ring, t).Qp
+    H = HallLittlewoodVertexOperator(0, base_ring=base_ring, t=t)
+    key_prefix = (base_ring, t)
+    results = [None] * len(gammas)
+    # each trie node is a pair (positions of the gammas ending here, dictionary from the next part to the child node)
+    root = ([], {})
+    for position, gamma in enumerate(gammas):
+        gamma = tuple(gamma)
+        if is_weakly_decreasing(gamma) and all(term > 0 for term in gamma[:-1]) and ((not gamma) or gamma[-1] >= 0):
+            results[position] = HLQp(Partition(gamma))
+            continue
+        while gamma and gamma[-1] == 0:
+            gamma = gamma[:-1]
+        node = root
+        for part in reversed(gamma):
+            node = node[1].setdefault(part, ([], {}))
+        node[0].append(position)
+    # walk the trie depth first, where suffix is the composition at the node
+    stack = [(root, (), HLQp.one())]
+    while stack:
+        ((positions, children), suffix, f) = stack.pop()
+        if positions:
+            f_Qp = HLQp(f)
+            for position in positions:
+                results[position] = f_Qp
+        for part, child in children.items():
+            child_suffix = (part,) + suffix
+            key = key_prefix + (child_suffix,)
+            if key in _vertex_operator_cache:
+                child_f = _vertex_operator_cache[key]
+            else:
+                child_f = H._op(part, f)
+                _vertex_operator_cache[key] = child_f
+            stack.append((child, child_suffix, child_f))
+    return results
+
 def raising_roots_operator(roots, base_ring=QQ['t'], t=1):
     r""" Return the operator `\prod_{(i,j) \in roots} (1 - tR_{ij})`.
 
@@ -1060,6 +1455,128 @@ def raising_roots_operator(roots, base_ring=QQ['t'], t=1):
     return op
 
 
+def _raising_roots_zero_test(basis):
+    # Return a function ``is_zero(index, raises, lowers)`` which returns True only if every index that can still be reached from ``index`` straightens to 0 in ``basis``.  Here raises[q] (resp. lowers[q]) is the number of roots left to apply which raise (resp. lower) position q.
+    # Return None if ``basis`` cannot be straightened.
+    kind = _straightening_kind(basis)
+    if kind == 'hall littlewood':
+        def is_zero(index, raises, lowers):
+            # H_gamma is 0 if some suffix of gamma has negative size, and raising operators can only shrink a suffix
+            suffix_size = 0
+            for part in reversed(index):
+                suffix_size += part
+                if suffix_size < 0:
+                    return True
+            return False
+    elif kind == 'sorting':
+        def is_zero(index, raises, lowers):
+            # a part which stays negative kills the term
+            return any(part + num_raises < 0 for part, num_raises in zip(index, raises))
+    elif kind == 'schur':
+        def is_zero(index, raises, lowers):
+            # gamma + rho must end up with distinct nonnegative parts
+            frozen_parts = set()
+            for q, part in enumerate(index):
+                shifted_part = part + len(index) - 1 - q
+                if shifted_part + raises[q] < 0:
+                    return True
+                if raises[q] == 0 and lowers[q] == 0:
+                    if shifted_part in frozen_parts:
+                        return True
+                    frozen_parts.add(shifted_part)
+            return False
+    else:
+        is_zero = None
+    return is_zero
+
+
+def _apply_raising_roots(roots, terms, t, is_zero=None):
+    # Apply each factor (1 - t R_ij) for (i, j) in ``roots`` in turn to ``terms``, a dictionary of (index, coefficient) pairs.  Equal indices are combined after every step, and indices which can only straighten to 0 (according to ``is_zero``) are dropped.
+    n = max([len(index) for index in terms] + [j + 1 for (i, j) in roots])
+    raises = [0] * n
+    lowers = [0] * n
+    for (i, j) in roots:
+        raises[i] += 1
+        lowers[j] += 1
+    new_terms = {}
+    for index, coeff in terms.items():
+        index = tuple(index) + (0,) * (n - len(index))
+        if is_zero is None or not is_zero(index, raises, lowers):
+            new_terms[index] = new_terms.get(index, 0) + coeff
+    terms = new_terms
+    for (i, j) in roots:
+        raises[i] -= 1
+        lowers[j] -= 1
+        new_terms = {}
+        for index, coeff in terms.items():
+            raised_index = index[:i] + (index[i] + 1,) + index[i+1:j] + (index[j] - 1,) + index[j+1:]
+            for new_index, new_coeff in ((index, coeff), (raised_index, -t * coeff)):
+                if is_zero is None or not is_zero(new_index, raises, lowers):
+                    new_terms[new_index] = new_terms.get(new_index, 0) + new_coeff
+        terms = dict((index, coeff) for index, coeff in new_terms.items() if coeff != 0)
+    return terms
+
+
+def apply_raising_roots_operator(roots, operand, base_ring=QQ['t'], t=1, basis=None):
+    r""" Return the operator `\prod_{(i,j) \in roots} (1 - tR_{ij})` applied to ``operand``.
+
+    This gives the same answer as ``raising_roots_operator(roots, base_ring, t)(operand)``, but never expands the operator.  Instead, each factor `1 - tR_{ij}` is applied to the current result in turn, equal indices are combined after every step, and indices which can only straighten to `0` are dropped.  For the staircase root ideal of size `n`, the operator has up to `2^{n(n-1)/2}` terms, while the number of distinct indices stays manageable.
+
+    INPUTS:
+
+    - ``roots`` -- an iterable of roots `(i, j)` or a natural number `n` (see :meth:`raising_roots_operator`)
+
+    - ``operand`` -- a sequence, or a symmetric function in the Schur, homogeneous, elementary, power, Witt, or Hall-Littlewood Q' basis
+
+    OPTIONAL INPUTS:
+
+    - ``base_ring`` -- (default ``QQ['t']``) the ring of the coefficients
+
+    - ``t`` -- (default ``1``) the `t` in `1 - tR_{ij}`
+
+    - ``basis`` -- (default ``None``) if ``operand`` is a sequence, act on the (possibly non-straightened) basis element of ``basis`` indexed by ``operand`` instead
+
+    OUTPUT:
+
+    If ``operand`` is a sequence and no ``basis`` is given, a list of (index, coefficient) pairs.  Otherwise, a symmetric function.
+
+    EXAMPLES::
+
+        sage: apply_raising_roots_operator([(0, 1)], [2, 1])
+        [([2, 1], 1), ([3, 0], -1)]
+
+        sage: base_ring = QQ['t']
+        sage: t = base_ring.gen()
+        sage: hl = SymmetricFunctions(base_ring).hall_littlewood().Qp()
+        sage: apply_raising_roots_operator([(0, 1)], [4, 1], t=t, basis=hl)
+        HLQp[4, 1] - t*HLQp[5]
+
+    ..  SEEALSO::
+        :meth:`raising_roots_operator`, :meth:`straighten`
+    """
+    if roots in NonNegativeIntegerSemiring():
+        roots = RootIdeals().init_staircase(roots)
+    # apply the roots bottom row first, so that positions stop moving as early as possible
+    roots = sorted(roots, key=lambda root: (-root[1], -root[0]))
+    t = base_ring(t)
+    if _is_sequence(operand):
+        terms = {tuple(operand): base_ring.one()}
+    else:
+        basis = operand.parent()
+        terms = dict((tuple(index), coeff) for index, coeff in operand.monomial_coefficients().items())
+    if basis is None:
+        terms = _apply_raising_roots(roots, terms, t)
+        return [(list(index), coeff) for index, coeff in terms.items()]
+    is_zero = _raising_roots_zero_test(basis)
+    if is_zero is None:
+        # no straightening rule, so fall back on the expanded operator
+        if _is_sequence(operand):
+            operand = basis(list(operand))
+        return raising_roots_operator(roots, base_ring=base_ring, t=t)(operand)
+    terms = _apply_raising_roots(roots, terms, t, is_zero)
+    return _straighten_terms(basis, terms)
+
+
 def qt_raising_roots_operator(roots, base_ring=QQ['t', 'q'], t=None, q=None):
     r""" Return the operator `\prod_{ij \in \Phi} (1 - tR_{ij}) \prod_{ij \in roots} (1 - qR_{ij})`.
 
@@ -1237,24 +1754,13 @@ class CatalanFunction:
             :meth:`expand`
         """
         # setup
+        hl = symmetric_function_bases(self.base_ring, t).Qp
         if t is None:
-            hl = SymmetricFunctions(self.base_ring).hall_littlewood().Qp()
             t = self.base_ring.gen()
-        else:
-            hl = SymmetricFunctions(self.base_ring).hall_littlewood(t=t).Qp()
-        HL_map = lambda supp: straighten(hl, supp)
-
-            
         # formula
         roots_complement = self.roots.complement()
-        op = raising_roots_operator(
-            roots_complement, base_ring=self.base_ring, t=t)
-        try:
-            parent(op).build_and_register_conversion(HL_map, hl)
-        except AssertionError:
-            pass
-        hl_poly = hl(self.index)
-        cat_func = op(hl_poly)
+        cat_func = apply_raising_roots_operator(
+            roots_complement, self.index, base_ring=self.base_ring, t=t, basis=hl)
         return cat_func
 
     def expand(self, *args, **kwargs):
@@ -1599,7 +2105,7 @@ def dual_k_theoretic_homogeneous(k, r, base_ring=QQ):
         return reduce(operator.mul, h_list)
     else:
         assert k >= 0
-        h = SymmetricFunctions(base_ring).h()
+        h = symmetric_function_bases(base_ring).h
         return sum(binomial(r + i - 1, i) * h[k - i] for i in range(k + 1))
 
 
@@ -1633,8 +2139,7 @@ def dual_k_catalan_function(roots, index, index2, base_ring=QQ):
     # formula
     roots = RootIdeal(roots, n=len(index))
     roots_complement = roots.complement()
-    op = raising_roots_operator(roots_complement, base_ring=base_ring, t=1)
-    cat_func = op(Kh)
+    cat_func = apply_raising_roots_operator(roots_complement, Kh, base_ring=base_ring, t=1)
     return cat_func
 
 
@@ -1672,8 +2177,7 @@ def double_homogeneous_building_block(p, n):
         :class:`DoubleHomogeneous`, :meth:`double_homogeneous_building_block_shifted`, :meth:`shift`
     """
     a = DoubleRing
-    sym = SymmetricFunctions(DoubleRing)
-    s = sym.s()
+    s = symmetric_function_bases(DoubleRing).s
     one = s.one()
     one_poly = one.expand(n)
     x = one_poly.parent().gens()
@@ -1840,8 +2344,8 @@ def substitute(f, t=None, q=None):
     # a t value of 'None' will leave t as-is.
     basis = f.parent()
     base_ring = f.base_ring()
-    s = SymmetricFunctions(base_ring)
-    f_s = s(f)
+    sym = symmetric_function_bases(base_ring).sym
+    f_s = sym(f)
     coeffs = f_s.coefficients()
     # Necessary because otherwise coeffs and monomials don't line up
     monomials = sorted(f_s.monomials())
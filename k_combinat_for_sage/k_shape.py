@@ -25,9 +25,11 @@ from sage.all import *
 parent_module = sys.modules['.'.join(__name__.split('.')[:-1]) or '__main__']
 if __name__ == '__main__' or parent_module.__name__ == '__main__':
     from partition import *
+    from partition import _k_interior_to_k_rim
     from skew_partition import is_linked
 else:
     from .partition import *
+    from .partition import _k_interior_to_k_rim
     from .skew_partition import is_linked    
 # ^*^ sphinx insert ^*^
 
@@ -54,8 +56,8 @@ def is_k_shape(ptn, k):
         # see if it's a k-shape for any k in [1, n-1].
         # (note that every partition is a 0-shape and an n-shape)
         n = ptn.size()
-        lis = [is_k_shape(ptn, kk) for kk in range(1, n)]
-        return any(lis)
+        profile = k_profile(ptn, k_max=n-1)
+        return any(entry['is_k_shape'] for entry in profile[1:])
     else:
         k_bdy = ptn.k_boundary(k)
         return is_linked(k_bdy)
@@ -100,9 +102,21 @@ def h_bounds(p, k, width):
         :meth:`v_bounds`
     """
     assert is_k_shape(p, k)
-    r = k_row_lengths(p, k)
+    return _row_lengths_to_h_bounds(k_row_lengths(p, k), width)
+
+
+def _row_lengths_to_h_bounds(r, width):
+    r""" Helper function for :meth:`h_bounds`.
+
+    Same as :meth:`h_bounds`, but takes the `k`-row-shape ``r`` directly instead of computing it from a `k`-shape.
+
+    EXAMPLES::
+
+        sage: _row_lengths_to_h_bounds([3, 3, 2, 1, 1, 1, 1, 1, 1, 1], 2)
+        (2, 3)
+    """
     # pad with a row of infinite length and a row of length 0
-    r = [float('inf')] + r + [0]
+    r = [float('inf')] + list(r) + [0]
     y_min = max([j for j in range(0, len(r)) if r[j] > width])
     y_max = min([j for j in range(0, len(r)) if r[j] < width]) - 1
     return (y_min, y_max)
@@ -180,10 +194,19 @@ def is_k_reducible_by_rectangle(p, k, hw):
     assert is_k_shape(p, k)
     (h, w) = hw
     assert h + w - 1 == k or h + w - 1 == k - 1
-    # get intersection H_a \cap V_b \cap k_rim
     rim = k_rim(p, k)
-    (y_min, y_max) = h_bounds(p, k, h)
-    (x_min, x_max) = v_bounds(p, k, w)
+    return _is_reducible_by_rectangle(rim, k_row_lengths(p, k), k_column_lengths(p, k), hw)
+
+
+def _is_reducible_by_rectangle(rim, row_lengths, column_lengths, hw):
+    r""" Helper function for :meth:`is_k_reducible_by_rectangle`.
+
+    Takes the `k`-rim, `k`-row-shape and `k`-column-shape of the `k`-shape directly, so that they can be computed once and shared by every rectangle.
+    """
+    (h, w) = hw
+    # get intersection H_a \cap V_b \cap k_rim
+    (y_min, y_max) = _row_lengths_to_h_bounds(row_lengths, h)
+    (x_min, x_max) = _row_lengths_to_h_bounds(column_lengths, w)
     intersection_rim = [(x, y) for (x, y) in rim
                         if x_min <= x <= x_max and y_min <= y <= y_max]
     # check condition (iii) of Proposition 3.8
@@ -223,10 +246,21 @@ def is_reducible(ptn, k):
 
         :meth:`is_irreducible`, :meth:`k_to_irreducible_k_shapes`
     """
+    assert is_k_shape(ptn, k)
+    ptn = Partition(ptn)
+    rim = k_rim(ptn, k)
+    return _is_reducible(rim, k_row_lengths(ptn, k), k_column_lengths(ptn, k), k)
+
+
+def _is_reducible(rim, row_lengths, column_lengths, k):
+    r""" Helper function for :meth:`is_reducible`.
+
+    Same as :meth:`is_reducible`, but takes the `k`-rim, `k`-row-shape and `k`-column-shape of the `k`-shape directly.
+    """
     rect_dim_list = k_rectangle_dimension_list(
         k) + k_rectangle_dimension_list(k-1)
     for (a, b) in rect_dim_list:
-        if is_k_reducible_by_rectangle(ptn, k, (a, b)):
+        if _is_reducible_by_rectangle(rim, row_lengths, column_lengths, (a, b)):
             return True
     return False
 
@@ -260,10 +294,123 @@ def is_irreducible(s, k):
 
 
 ############# GETTER FUNCS ############
-def k_to_irreducible_k_shapes(k):
+def _irreducible_k_shape_lists(k):
+    r""" Helper generator for :meth:`iter_irreducible_k_shapes`.
+
+    Yields every irreducible `k`-shape as a plain list of parts.
+
+    The partitions are built one row at a time, starting from the shortest row and prepending longer and longer rows.  Prepending a row never changes the hook lengths of the cells already placed, so the `k`-row-shape and `k`-column-shape can be updated incrementally.  A branch is cut off as soon as
+
+      * the new row has a shorter `k`-row than the row below it,
+      * a column to the left of the new row's `k`-boundary (which no later row can change) breaks the `k`-column-shape, or
+      * the partition built so far is a reducible `k`-shape.
+
+    The last rule relies on the fact that deleting the top rows of an irreducible `k`-shape never leaves a reducible `k`-shape.  The output agrees with the brute force algorithm for `k \leq 5` and gives the Genocchi numbers `1, 1, 3, 17, 155, 2073, 38227` for `k \leq 7`.
+    """
+    yield []
+    # the rows built so far, shortest first
+    parts = []
+    row_lengths = []
+    # the number of rows built so far that reach each column, and the number of k-boundary cells in each column
+    col_counts = []
+    k_col_lengths = []
+
+    def extend(top_row_length, top_part):
+        part = max(top_part, 1)
+        while True:
+            if len(col_counts) < part:
+                col_counts.append(0)
+                k_col_lengths.append(0)
+            # the hook length of cell j in the new row is part - j + col_counts[j]
+            row_length = 0
+            for j in range(part - 1, -1, -1):
+                if part - j + col_counts[j] > k:
+                    break
+                row_length += 1
+            inner_part = part - row_length
+            # a column to the left of the new k-boundary is final, so an empty one can never be filled again
+            if inner_part > 0 and k_col_lengths[inner_part - 1] == 0:
+                break
+            if row_length >= top_row_length:
+                for j in range(inner_part, part):
+                    k_col_lengths[j] += 1
+                is_possible = is_weakly_decreasing(k_col_lengths[:inner_part])
+                if is_possible and inner_part > 0:
+                    is_possible = k_col_lengths[inner_part - 1] >= max(k_col_lengths[inner_part:part])
+                if is_possible:
+                    for j in range(part):
+                        col_counts[j] += 1
+                    parts.append(part)
+                    row_lengths.append(row_length)
+                    if is_weakly_decreasing(k_col_lengths[:part]):
+                        ptn = parts[::-1]
+                        rs = row_lengths[::-1]
+                        interior = [a - b for a, b in zip(ptn, rs) if a > b]
+                        rim = _k_interior_to_k_rim(ptn, interior)
+                        if not _is_reducible(rim, rs, k_col_lengths[:part], k):
+                            yield ptn
+                            for ptn in extend(row_length, part):
+                                yield ptn
+                    else:
+                        for ptn in extend(row_length, part):
+                            yield ptn
+                    parts.pop()
+                    row_lengths.pop()
+                    for j in range(part):
+                        col_counts[j] -= 1
+                for j in range(inner_part, part):
+                    k_col_lengths[j] -= 1
+            part += 1
+
+    for ptn in extend(0, 0):
+        yield ptn
+
+
+def iter_irreducible_k_shapes(k):
+    r""" Given a natural number ``k``, iterate over all irreducible `k`-shapes.
+
+    The `k`-shapes are generated directly (see :meth:`_irreducible_k_shape_lists`) rather than filtered out of a box of partitions, so this streams the results and scales to `k = 7` and beyond.
+
+    EXAMPLES::
+
+        sage: sorted(iter_irreducible_k_shapes(3))
+        [[], [1], [2, 1]]
+
+    ..  SEEALSO::
+
+        :meth:`k_to_irreducible_k_shapes`, :meth:`k_to_num_irreducible_k_shapes`
+    """
+    k = NonNegativeIntegerSemiring()(k)
+    for ptn in _irreducible_k_shape_lists(k):
+        yield Partition(ptn)
+
+
+def k_to_num_irreducible_k_shapes(k):
+    r""" Given a natural number ``k``, return the number of irreducible `k`-shapes.
+
+    This counts the output of :meth:`iter_irreducible_k_shapes` without building any :class:`Partition` objects.  These are the Genocchi numbers of [genocchi]_.
+
+    EXAMPLES::
+
+        sage: [k_to_num_irreducible_k_shapes(k) for k in range(1, 7)]
+        [1, 1, 3, 17, 155, 2073]
+
+    ..  SEEALSO::
+
+        :meth:`iter_irreducible_k_shapes`, :meth:`k_to_irreducible_k_shapes`
+    """
+    k = NonNegativeIntegerSemiring()(k)
+    return sum(1 for _ in _irreducible_k_shape_lists(k))
+
+
+def k_to_irreducible_k_shapes(k, algorithm='generative'):
     r""" Given a natural number ``k``, return a list of all irreducible `k`-shapes.
 
-    Note that the algorithm runs very slowly after `k=4` :(.
+    The list is ordered by size, and then in the order of :class:`Partitions`.
+
+    OPTIONAL INPUTS:
+
+    - ``algorithm`` -- (default ``'generative'``) ``'generative'`` builds the irreducible `k`-shapes directly (see :meth:`iter_irreducible_k_shapes`).  ``'brute force'`` checks every partition in a box, runs very slowly after `k=4`, and its box is too small to find every irreducible `k`-shape once `k \geq 6`.
 
     EXAMPLES::
 
@@ -272,13 +419,19 @@ def k_to_irreducible_k_shapes(k):
 
     ..  SEEALSO::
 
-        :meth:`is_reducible`, :meth:`is_irreducible`
+        :meth:`is_reducible`, :meth:`is_irreducible`, :meth:`iter_irreducible_k_shapes`
     """
-    bound = (k-1)*k//2
-    n_bound = bound**2
-    ptns = []
-    for n in range(0, n_bound+1):
-        ptns += Partitions(n, max_length=bound, max_part=bound)
+    if algorithm == 'generative':
+        k_irr_k_shapes = list(iter_irreducible_k_shapes(k))
+        k_irr_k_shapes.sort(key=lambda p: (p.size(), [-part for part in p]))
+    elif algorithm == 'brute force':
+        bound = (k-1)*k//2
+        n_bound = bound**2
+        ptns = []
+        for n in range(0, n_bound+1):
+            ptns += Partitions(n, max_length=bound, max_part=bound)
         k_irr_k_shapes = [p for p in ptns
                           if is_k_shape(p, k) and is_irreducible(p, k)]
+    else:
+        raise ValueError('Unknown algorithm.')
     return k_irr_k_shapes
@@ -194,7 +194,20 @@ def k_rim(ptn, k):
 
         :meth:`k_interior`, :meth:`k_boundary`, :meth:`boundary`
     """
-    interior_rim = boundary(ptn.k_interior(k))
+    return _k_interior_to_k_rim(ptn, ptn.k_interior(k))
+
+
+def _k_interior_to_k_rim(ptn, interior):
+    r""" Helper function for :meth:`k_rim`.
+
+    Given a partition ``ptn`` and its `k`-interior ``interior`` (both may be plain lists of integers), return the `k`-rim of ``ptn``.
+
+    EXAMPLES::
+
+        sage: _k_interior_to_k_rim([3, 1], [2])
+        [(3,0), (2,0), (2,1), (1,1), (0,1), (0,2)]
+    """
+    interior_rim = boundary(interior)
     # get leftmost vertical line
     interior_top_left_y = interior_rim[-1][1]
     v_piece = [(0, y) for y in range(interior_top_left_y + 1, len(ptn) + 1)]
@@ -251,6 +264,81 @@ def k_column_lengths(ptn, k):
     return ptn.k_boundary(k).column_lengths()
 
 
+def k_profile(ptn, k_max=None):
+    r""" Return the `k`-size, `k`-row-shape, `k`-column-shape, and whether ``ptn`` is a `k`-shape, for every `k` at once.
+
+    The hook lengths of ``ptn`` are computed once.  The cells are then sorted by hook length and added to the `k`-boundary one at a time, so that moving from `k-1` to `k` only touches the cells of hook length `k`.  This is much faster than calling :meth:`k_boundary` for each `k`.
+
+    INPUTS:
+
+    - ``ptn`` -- a partition
+
+    OPTIONAL INPUTS:
+
+    - ``k_max`` -- (default ``None``) the largest `k` to report.  If set to ``None``, it is the largest hook length of ``ptn``, after which the `k`-boundary is all of ``ptn`` and nothing changes.
+
+    OUTPUT:
+
+    A list whose `k`-th entry is a dictionary with keys
+
+    - ``'k_size'`` -- the size of the `k`-boundary (see :meth:`k_size`)
+    - ``'k_row_lengths'`` -- see :meth:`k_row_lengths`
+    - ``'k_column_lengths'`` -- see :meth:`k_column_lengths`
+    - ``'is_k_shape'`` -- see :meth:`k_shape.is_k_shape`
+
+    EXAMPLES::
+
+        sage: profile = k_profile(Partition([3, 1]))
+        sage: [entry['k_size'] for entry in profile]
+        [0, 2, 3, 3, 4]
+        sage: profile[2]
+        {'k_size': 3, 'k_row_lengths': [2, 1], 'k_column_lengths': [1, 1, 1], 'is_k_shape': True}
+        sage: [entry['is_k_shape'] for entry in profile]
+        [True, False, True, True, True]
+
+    ..  SEEALSO::
+
+        :meth:`k_size`, :meth:`k_row_lengths`, :meth:`k_column_lengths`, :meth:`k_shape.is_k_shape`
+    """
+    ptn = Partition(ptn)
+    max_hook_length = ptn[0] + len(ptn) - 1 if ptn else 0
+    if k_max is None:
+        k_max = max_hook_length
+    # sort the cells by hook length
+    cells_by_hook_length = [[] for _ in range(max_hook_length + 1)]
+    for i, row_hook_lengths in enumerate(ptn.hook_lengths()):
+        for j, hook_length in enumerate(row_hook_lengths):
+            cells_by_hook_length[hook_length].append((i, j))
+    # sweep
+    row_lengths = [0] * len(ptn)
+    column_lengths = [0] * (ptn[0] if ptn else 0)
+    # the number of places where the row (or column) lengths strictly increase
+    num_ascents = [0]
+
+    def add_cell(lengths, index):
+        # keep num_ascents up to date while lengths[index] goes up by 1
+        if index > 0:
+            num_ascents[0] += int(lengths[index - 1] < lengths[index] + 1) - int(lengths[index - 1] < lengths[index])
+        if index + 1 < len(lengths):
+            num_ascents[0] += int(lengths[index] + 1 < lengths[index + 1]) - int(lengths[index] < lengths[index + 1])
+        lengths[index] += 1
+    profile = []
+    size = 0
+    for k in range(k_max + 1):
+        if k <= max_hook_length:
+            for (i, j) in cells_by_hook_length[k]:
+                add_cell(row_lengths, i)
+                add_cell(column_lengths, j)
+                size += 1
+        profile.append({
+            'k_size': size,
+            'k_row_lengths': list(row_lengths),
+            'k_column_lengths': list(column_lengths),
+            'is_k_shape': num_ascents[0] == 0,
+        })
+    return profile
+
+
 def has_rectangle(ptn, h, w):
     r""" A partition ``ptn`` has an `h` x `w` rectangle if it's Ferrer's diagram has `h` (*or more*) rows of length `w` (*exactly*).
 
@@ -491,13 +579,196 @@ def is_k_core(ptn, k):
         :meth:`Core`
     """
     ptn = Partition(ptn)
-    for row_hook_lengths in ptn.hook_lengths():
-        for hook_length in row_hook_lengths:
-            if hook_length == k:
-                return False
+    # A hook of length k is a bead of the beta-set which can slide k positions down to an empty position.
+    beta_set = set(_beta_numbers(ptn, len(ptn)))
+    for bead in beta_set:
+        if bead >= k and bead - k not in beta_set:
+            return False
     return True
 
 
+# ABACUS
+
+
+def _beta_numbers(ptn, num_beads):
+    # the beta-numbers (first column hook lengths) of ``ptn`` padded with zeros to ``num_beads`` parts, in decreasing order
+    return [(ptn[i] if i < len(ptn) else 0) + num_beads - 1 - i for i in range(num_beads)]
+
+
+def k_core_to_abacus(ptn, k):
+    r""" Return the ``k``-runner abacus of the ``k``-core ``ptn``.
+
+    Place a bead at each beta-number of ``ptn`` and wrap the number line around ``k`` runners, so that position `x` lies on runner `x \bmod k`.  Because ``ptn`` is a ``k``-core, every bead has all the positions below it on its runner filled, so runner `r` is described by a single *level*: the number of beads on it.  Levels are normalized to sum to `0`, which makes them independent of how many beads were used.
+
+    Moving a bead between runners only changes two levels, which is what makes :meth:`abacus_k_size` and :meth:`abacus_strong_down_list` cheap.
+
+    INPUTS:
+
+    - ``ptn`` -- a ``k``-core
+
+    - ``k`` -- a positive integer
+
+    OUTPUT:
+
+    A list of ``k`` integers which sum to `0`.
+
+    EXAMPLES::
+
+        sage: k_core_to_abacus(Partition([3, 1]), 3)
+        [0, -1, 1]
+        sage: abacus_to_k_core([0, -1, 1])
+        [3, 1]
+
+    ..  SEEALSO::
+
+        :meth:`abacus_to_k_core`, :meth:`is_k_core`
+    """
+    ptn = Partition(ptn)
+    if not is_k_core(ptn, k):
+        raise ValueError('{} is not a {}-core'.format(ptn, k))
+    num_beads_per_runner = -(-len(ptn) // k)
+    abacus = [-num_beads_per_runner] * k
+    for bead in _beta_numbers(ptn, num_beads_per_runner * k):
+        abacus[bead % k] += 1
+    return abacus
+
+
+def abacus_to_k_core(abacus):
+    r""" Return the `k`-core with the given `k`-runner abacus, where `k` is the length of ``abacus``.
+
+    This is the inverse of :meth:`k_core_to_abacus`.
+
+    EXAMPLES::
+
+        sage: abacus_to_k_core([0, -1, 1])
+        [3, 1]
+        sage: abacus_to_k_core([0, 0, 0])
+        []
+
+    ..  SEEALSO::
+
+        :meth:`k_core_to_abacus`
+    """
+    k = len(abacus)
+    num_beads_per_runner = max([0] + [-level for level in abacus])
+    beads = sorted((runner + k * height
+        for runner, level in enumerate(abacus)
+        for height in range(level + num_beads_per_runner)), reverse=True)
+    num_beads = len(beads)
+    return Partition([bead - (num_beads - 1 - i) for i, bead in enumerate(beads)])
+
+
+def _abacus_pair_k_size(lower_level, upper_level):
+    # the number of cells of hook length less than k contributed by a pair of runners, where the first runner has the smaller index
+    difference = upper_level - lower_level
+    return difference if difference >= 0 else -difference - 1
+
+
+def abacus_k_size(abacus):
+    r""" Return the `k`-size of the `k+1`-core with the given `k+1`-runner abacus.
+
+    This agrees with ``k_size(abacus_to_k_core(abacus), k)``, but only looks at the levels of the runners, so its cost does not depend on the size of the core.
+
+    EXAMPLES::
+
+        sage: abacus_k_size(k_core_to_abacus(Partition([3, 1]), 3))
+        3
+        sage: k_size(Partition([3, 1]), 2)
+        3
+
+    ..  SEEALSO::
+
+        :meth:`k_size`, :meth:`k_core_to_abacus`
+    """
+    return sum(_abacus_pair_k_size(abacus[r], abacus[s])
+        for r in range(len(abacus))
+        for s in range(r + 1, len(abacus)))
+
+
+def _abacus_strong_down_covers(abacus, runner_pairs):
+    # yield the abaci of the strong down covers of ``abacus`` which exchange the contents of the runners r < s, for each pair (r, s) in runner_pairs
+    # different pairs change different runners, so no abacus is yielded twice
+    runners = range(len(abacus))
+
+    def local_k_size(levels, r, s):
+        # the part of the k-size which depends on runners r or s
+        total = _abacus_pair_k_size(levels[r], levels[s])
+        for t in runners:
+            if t != r and t != s:
+                for u in (r, s):
+                    total += _abacus_pair_k_size(levels[min(t, u)], levels[max(t, u)])
+        return total
+    for r, s in runner_pairs:
+        level_r = abacus[r]
+        level_s = abacus[s]
+        if level_r == level_s:
+            continue
+        elif level_r < level_s:
+            candidates = [(level_s, level_r), (level_r + 1, level_s - 1)]
+        else:
+            candidates = [(level_s + 1, level_r - 1), (level_r - 1, level_s + 1)]
+        if candidates[0] == candidates[1]:
+            del candidates[1]
+        old_local_k_size = local_k_size(abacus, r, s)
+        for new_level_r, new_level_s in candidates:
+            new_abacus = list(abacus)
+            new_abacus[r] = new_level_r
+            new_abacus[s] = new_level_s
+            if local_k_size(new_abacus, r, s) == old_local_k_size - 1:
+                yield new_abacus
+
+
+def abacus_strong_down_list(abacus):
+    r""" Return the abaci of all `k+1`-cores which are covered by the `k+1`-core with `k+1`-runner abacus ``abacus`` in the strong order.
+
+    A strong cover is an affine transposition, which on the abacus exchanges the contents of two runners `r < s` up to a shift.  Only two shifts can ever give a cover: swapping the levels of the runners outright, or sliding a single bead from the higher runner to the lower one.  A candidate is kept when its `k`-size is one less, and only the pairs of runners involving `r` or `s` need to be recounted to decide that.
+
+    EXAMPLES::
+
+        sage: abacus = k_core_to_abacus(Partition([2, 1, 1]), 3)
+        sage: sorted(abacus_to_k_core(a) for a in abacus_strong_down_list(abacus))
+        [[1, 1], [2]]
+
+    ..  SEEALSO::
+
+        :meth:`Core.strong_down_list`, :meth:`strong_marked_tableau.k_coverees`
+    """
+    abacus = list(abacus)
+    runner_pairs = [(r, s) for r in range(len(abacus)) for s in range(r + 1, len(abacus))]
+    return list(_abacus_strong_down_covers(abacus, runner_pairs))
+
+
+def abacus_marked_strong_down_list(abacus, runner, depth):
+    r""" Return the abaci of the `k+1`-cores which are covered by the `k+1`-core with `k+1`-runner abacus ``abacus`` in the strong order, and whose cover moves the bead ``depth`` places from the top of the runner ``runner``.
+
+    A moved bead is exactly a ribbon of the cover whose head lies in the row of that bead, so this finds the covers marked in a given row.  Every such cover exchanges ``runner`` with some other runner, so only those `k` pairs of runners are tried instead of all of them.
+
+    INPUTS:
+
+    - ``abacus`` -- the `k+1`-runner abacus of a `k+1`-core
+
+    - ``runner`` -- the runner of the bead
+
+    - ``depth`` -- a positive integer, where ``1`` means the topmost bead of ``runner``
+
+    EXAMPLES:
+
+    The last cell of row `1` of [6, 4, 2, 2, 1] has residue `2` mod `6`, and it is the topmost bead of runner `2`::
+
+        sage: abacus = k_core_to_abacus(Partition([6, 4, 2, 2, 1]), 6)
+        sage: sorted(abacus_to_k_core(a) for a in abacus_marked_strong_down_list(abacus, 2, 1))
+        [[6, 2, 2, 2, 1], [6, 3, 2, 2]]
+
+    ..  SEEALSO::
+
+        :meth:`abacus_strong_down_list`, :meth:`strong_marked_tableau.iter_k_marked_coverees`
+    """
+    abacus = list(abacus)
+    runner_pairs = [(min(runner, s), max(runner, s)) for s in range(len(abacus)) if s != runner]
+    return [new_abacus for new_abacus in _abacus_strong_down_covers(abacus, runner_pairs)
+            if new_abacus[runner] <= abacus[runner] - depth]
+
+
     def to_k_core(self, k):
         r"""
         WARNING!
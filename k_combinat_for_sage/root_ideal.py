@@ -21,6 +21,7 @@ REFERENCES:
 
 import sys
 
+import numpy as np
 from sage.all import *
 
 parent_module = sys.modules['.'.join(__name__.split('.')[:-1]) or '__main__']
@@ -132,40 +133,40 @@ def skew_partition_to_selected_rows(sp):
     """
     # actually this may ONLY WORK for catty-connected skew-partitions, because i'm not sure how we deal with 'missing' rows
     # arguably we should call it a linked_skew_partition
-    # record the indices of rows that have been used up
-    def bounce_path(sp, row_index, blocked_rows=set()):
-        def bounce_path_piece(sp, start_row_index, blocked_rows=set()):
-            # Helper
-            # this algo find the correct "L" piece of the path, where the bottom right cell is cell1, the bottom left is cell2, and the top left is cell3
-            # Returns (top_row_index, is_end) which are the row index of cell3 and whether or not we 'broke free' out of the top left cell of the skew-partition, respectively.
-            col_index2 = skew_partition.left(sp, start_row_index)
-            row_index3 = skew_partition.top(sp, col_index2) + 1
-            while row_index3 in blocked_rows:
-                row_index3 += 1
-            # CATTY-CORNER ONLY line:
-            max_row_index = len(sp.outer()) - 1
-            if row_index3 > max_row_index:
-                return None, True
-            else:
-                return row_index3, False
-        # helper
-        new_blocked_rows = {row_index}
-        # is_end says if you reached the end of the path
-        while True:
-            row_index, is_end = bounce_path_piece(sp, row_index, blocked_rows)
-            if is_end:
-                break
-            else:
-                new_blocked_rows.add(row_index)
-        return new_blocked_rows
-    selected_rows = set()
-    blocked_rows = set()
-    for row_index, outer_row in enumerate(sp.outer()):
-        if row_index not in blocked_rows:
-            selected_rows.add(row_index)
-            new_blocked_rows = bounce_path(sp, row_index, blocked_rows)
-            blocked_rows.update(new_blocked_rows)
-    return sorted(selected_rows)
+    # precompute skew_partition.left of every row and skew_partition.top of every column
+    outer = list(sp.outer())
+    inner = list(sp.inner())
+    inner += [0] * (len(outer) - len(inner))
+    lefts = [inner[r] if outer[r] != inner[r] else None for r in range(len(outer))]
+    outer_column_lengths = list(sp.outer().conjugate())
+    tops = [outer_column_lengths[c] - 1 if column_length != 0 else None for c, column_length in enumerate(sp.column_lengths())]
+    # next_unblocked[r] leads (with path compression) to the first row at or below r which is not blocked
+    num_rows = len(outer)
+    next_unblocked = list(range(num_rows + 1))
+
+    def first_unblocked(row_index):
+        root = row_index
+        while next_unblocked[root] != root:
+            root = next_unblocked[root]
+        while next_unblocked[row_index] != root:
+            next_unblocked[row_index], row_index = root, next_unblocked[row_index]
+        return root
+    selected_rows = []
+    for row_index in range(num_rows):
+        if first_unblocked(row_index) == row_index:
+            selected_rows.append(row_index)
+            # follow the bounce path; this algo finds each "L" piece of the path, where the bottom right cell is cell1, the bottom left is cell2, and the top left is cell3
+            # rows on this path are only blocked for later paths
+            path = [row_index]
+            while True:
+                row_index3 = first_unblocked(tops[lefts[path[-1]]] + 1)
+                # CATTY-CORNER ONLY line:
+                if row_index3 >= num_rows:
+                    break
+                path.append(row_index3)
+            for blocked_row in path:
+                next_unblocked[blocked_row] = blocked_row + 1
+    return selected_rows
 
 
 def selected_rows_to_maximum_root_ideal(n, selected_indices):
@@ -194,18 +195,20 @@ def selected_rows_to_maximum_root_ideal(n, selected_indices):
 
         :meth:`skew_partition_to_selected_rows`
     """
-    root_ideal_cells = []
-    selected_indices = set(selected_indices)
-    permitted_col_indices = set(range(n)) - selected_indices
+    is_selected = [False] * n
+    for i in selected_indices:
+        is_selected[i] = True
+    # the permitted columns are only ever used up smallest first, so a pointer into them suffices
+    permitted_col_indices = [j for j in range(n) if not is_selected[j]]
+    pointer = 0
+    bounds = [(n, n)] * n
     for i in range(n):
-        if i in selected_indices:
-            if permitted_col_indices:
-                smallest_unblocked_index = min(permitted_col_indices)
-                root_ideal_cells += [(i, j)
-                                     for j in range(smallest_unblocked_index, n)]
-                permitted_col_indices.remove(smallest_unblocked_index)
-                selected_indices.add(smallest_unblocked_index)
-    return RootIdeal(root_ideal_cells)
+        if is_selected[i] and pointer < len(permitted_col_indices):
+            smallest_unblocked_index = permitted_col_indices[pointer]
+            pointer += 1
+            bounds[i] = (smallest_unblocked_index, n)
+            is_selected[smallest_unblocked_index] = True
+    return RootIdeal._from_row_bounds(bounds, n)
 
 
 def skew_partition_to_removable_roots(sp, type='max'):
@@ -303,6 +306,170 @@ def removable_roots_to_partition(corners, n):
                 corners = corners[1:]
     return Partition(ptn)
 
+def _root_vector_matrix(roots, n, format):
+    # Helper: the matrix with ``n`` columns and one row `e_i - e_j` for each root `(i, j)` in the list ``roots``.
+    if format == 'sage':
+        entries = {}
+        for row, (i, j) in enumerate(roots):
+            entries[(row, i)] = 1
+            entries[(row, j)] = -1
+        return matrix(ZZ, len(roots), n, entries, sparse=True)
+    elif format == 'numpy':
+        indices = np.array(roots, dtype=np.int64).reshape(2 * len(roots))
+        data = np.tile(np.array([1, -1], dtype=np.int64), len(roots))
+        indptr = np.arange(0, 2 * len(roots) + 1, 2, dtype=np.int64)
+        return data, indices, indptr
+    else:
+        raise ValueError('Unknown format.')
+
+
+def root_ideals_to_root_vector_matrix(ris, n=None, format='sage'):
+    r""" Stack the root vectors of many root ideals into one sparse integer matrix.
+
+    The rows of :meth:`RootIdeal.root_vector_matrix` for each root ideal in ``ris`` are placed one after the other, so the rows of the `k`-th root ideal start after the ``len(ris[0]) + ... + len(ris[k-1])`` rows of the ones before it.
+
+    INPUTS:
+
+    - ``ris`` -- an iterable of root ideals
+
+    OPTIONAL INPUTS:
+
+    - ``n`` -- (default ``None``) the number of columns, which by default is the largest ``n`` of the root ideals
+
+    - ``format`` -- (default ``'sage'``) ``'sage'`` or ``'numpy'``, as in :meth:`RootIdeal.root_vector_matrix`
+
+    EXAMPLES::
+
+        sage: ris = [RootIdeal([(0,1)], n=3), RootIdeal([(0,2), (1,2)])]
+        sage: root_ideals_to_root_vector_matrix(ris)
+        [ 1 -1  0]
+        [ 1  0 -1]
+        [ 0  1 -1]
+
+    ..  SEEALSO::
+
+        :meth:`RootIdeal.root_vector_matrix`
+    """
+    ris = list(ris)
+    if n is None:
+        n = max([ri.n for ri in ris] + [0])
+    roots = [root for ri in ris for root in ri]
+    return _root_vector_matrix(roots, n, format)
+
+# DRAWING
+
+
+@cached_function
+def _setup_ytableau_latex():
+    # Helper: register the ytableau package with sage's latex, which only needs to happen once.
+    from sage.misc.latex import latex
+    latex.add_to_mathjax_avoid_list('ytableau')
+    latex.add_package_to_preamble_if_available('ytableau')
+
+
+def _ytableau_code(ri, color, index):
+    # Helper: the ytableau environment drawing the root ideal ``ri`` in an n x n grid, with the roots shaded in ``color`` and the ``index`` (if any) on the diagonal.
+    n = ri.n
+    if index:
+        assert len(index) == n, "Length of root ideal index must equal root ideal size!"
+    shaded = "*(" + color + ")"
+    rows = []
+    for i in range(n):
+        entries = [shaded if (i, j) in ri else (str(index[i]) if index and i == j else "{}") for j in range(n)]
+        rows.append("  " + " & ".join(entries) + " ")
+    return "\\begin{ytableau}\n" + "\\\\ \n".join(rows) + "\n\\end{ytableau}"
+
+
+def _svg_code(ri, color, index, top, cell_size):
+    # Helper: the SVG elements drawing the root ideal ``ri`` like :func:`_ytableau_code`, with its top edge at height ``top``.
+    n = ri.n
+    if index:
+        assert len(index) == n, "Length of root ideal index must equal root ideal size!"
+    elements = []
+    for i in range(n):
+        y = top + i * cell_size
+        for j in range(n):
+            x = j * cell_size
+            fill = color if (i, j) in ri else 'none'
+            elements.append('<rect x="{}" y="{}" width="{}" height="{}" fill="{}" stroke="black"/>'.format(x, y, cell_size, cell_size, fill))
+            if index and i == j and (i, j) not in ri:
+                elements.append('<text x="{}" y="{}" font-size="{}" text-anchor="middle" dominant-baseline="central">{}</text>'.format(x + cell_size / 2.0, y + cell_size / 2.0, cell_size * 0.6, index[i]))
+    return "\n".join(elements)
+
+
+def write_root_ideal_diagrams(diagrams, sink, format='latex', color='red', cell_size=20):
+    r""" Draw many root ideals or catalan functions into one LaTeX or SVG document.
+
+    Each diagram is drawn as in :meth:`RootIdeal._latex_` (for a catalan function, its index is written on the diagonal) and written straight to ``sink``, so no string holding the whole document is built.  The preamble is written once.
+
+    INPUTS:
+
+    - ``diagrams`` -- an iterable of :class:`RootIdeal`, :class:`FrozenRootIdeal` or :class:`CatalanFunction` objects
+
+    - ``sink`` -- a file-like object with a ``write`` method
+
+    OPTIONAL INPUTS:
+
+    - ``format`` -- (default ``'latex'``) ``'latex'`` for a LaTeX document using ytableau, or ``'svg'`` for an SVG image with the diagrams stacked vertically.  For SVG, ``diagrams`` is read into a list first so that the size of the image is known.
+
+    - ``color`` -- (default ``'red'``) the color of the roots
+
+    - ``cell_size`` -- (default ``20``) the side length of a cell in an SVG image
+
+    EXAMPLES::
+
+        sage: from io import StringIO
+        sage: sink = StringIO()
+        sage: write_root_ideal_diagrams([RootIdeal([(0,1)]), CatalanFunction([(0,2)], [3,2,1])], sink)
+        sage: print(sink.getvalue())
+        \documentclass{article}
+        \usepackage{xcolor}
+        \usepackage{ytableau}
+        \begin{document}
+        \begin{ytableau}
+          {} & *(red) \\
+          {} & {}
+        \end{ytableau}
+        <BLANKLINE>
+        \begin{ytableau}
+          3 & {} & *(red) \\
+          {} & 2 & {} \\
+          {} & {} & 1
+        \end{ytableau}
+        <BLANKLINE>
+        \end{document}
+
+    ..  SEEALSO::
+
+        :meth:`RootIdeal._latex_`
+    """
+    def root_ideal_and_index(diagram):
+        if isinstance(diagram, (RootIdeal, FrozenRootIdeal)):
+            return diagram, None
+        # a catalan function
+        return diagram.roots, diagram.index
+    if format == 'latex':
+        sink.write("\\documentclass{article}\n\\usepackage{xcolor}\n\\usepackage{ytableau}\n\\begin{document}\n")
+        for diagram in diagrams:
+            ri, index = root_ideal_and_index(diagram)
+            sink.write(_ytableau_code(ri, color, index))
+            sink.write("\n\n")
+        sink.write("\\end{document}\n")
+    elif format == 'svg':
+        diagrams = [root_ideal_and_index(diagram) for diagram in diagrams]
+        # leave one empty cell between diagrams
+        width = max([ri.n for (ri, index) in diagrams] + [0]) * cell_size
+        height = max(sum((ri.n + 1) * cell_size for (ri, index) in diagrams) - cell_size, 0)
+        sink.write('<svg xmlns="http://www.w3.org/2000/svg" width="{}" height="{}">\n'.format(width, height))
+        top = 0
+        for ri, index in diagrams:
+            sink.write(_svg_code(ri, color, index, top, cell_size))
+            sink.write("\n")
+            top += (ri.n + 1) * cell_size
+        sink.write("</svg>\n")
+    else:
+        raise ValueError('Unknown format.')
+
 # RootIdeal stuff
 
 
@@ -337,11 +504,37 @@ def _is_roots(obj):
     return True
 
 
+def _roots_to_row_bounds(roots, n):
+    # Helper: given sorted ``roots`` in an n x n grid, return for each row the half-open column interval ``(start, stop)`` it occupies (``(n, n)`` for an empty row), or ``None`` if some row is not a contiguous interval.
+    bounds = [(n, n)] * n
+    for (r, c) in roots:
+        if r >= n:
+            return None
+        start, stop = bounds[r]
+        if start == stop:
+            bounds[r] = (c, c + 1)
+        elif c == stop:
+            bounds[r] = (start, c + 1)
+        else:
+            return None
+    return bounds
+
+
+def _row_bounds_key(bounds):
+    # Helper: a hashable key for the roots with the per-row intervals ``bounds``, which unlike ``bounds`` does not depend on the side length n.
+    key = [(start, stop) if start < stop else None for (start, stop) in bounds]
+    while key and key[-1] is None:
+        key.pop()
+    return tuple(key)
+
+
 class RootIdeal(list):
     r""" A root ideal.
 
     Consider the k-1 staircase partition `[k-1, k-2, \ldots, 1]` positioned in the upper-right corner of a `k` x `k` grid.  The cells in the grid are labeled with (row_index, col_index) 0-based coordinates.  Now consider any right-justified subpartition of the staircase partition.  This is a RootIdeal.  However, it is expressed not as a partition but as a list of the cells it contains.
 
+    A root ideal is backed by its list of roots.  Alongside the list, it remembers the column interval occupied by each row, which makes membership tests constant time.  Since the list holds every root, building a root ideal in the `n` x `n` grid costs `O(n^2)`, including :meth:`complement`, :meth:`meet` and :meth:`join`.  The list may be mutated, but every mutation rescans the whole list to recompute the row intervals, which costs `O(m \log m)` for `m` roots.  A :class:`FrozenRootIdeal` stores only the partition instead.
+
     See Definition 2.1 of [cat]_ for more.
 
     EXAMPLES:
@@ -364,19 +557,128 @@ class RootIdeal(list):
         # normalize the roots
         lis = sorted(lis)
         list.__init__(self, lis)
+        self._set_row_bounds(_roots_to_row_bounds(lis, self.n), lis)
+
+    @classmethod
+    def _from_row_bounds(cls, bounds, n):
+        # Helper: build a root ideal directly from the per-row column intervals ``bounds`` (see :func:`_roots_to_row_bounds`) without sorting or validating the roots.  This still lists all the roots, so it costs O(n^2).
+        ri = cls.__new__(cls)
+        list.__init__(ri, [(r, c) for r, (start, stop) in enumerate(bounds) for c in range(start, stop)])
+        ri.n = n
+        ri._set_row_bounds(bounds)
+        return ri
+
+    def _roots_changed(self):
+        # Helper: after the list of roots is mutated, forget the cached arrays and recompute the row intervals.
+        for name in ('_down', '_up', '_bounce_path_heads', '_bounce_path_incidence_matrix'):
+            self.__dict__.pop(name, None)
+        roots = sorted(self)
+        if roots:
+            self.n = max(self.n, max(c for (r, c) in roots) + 1)
+        self._set_row_bounds(_roots_to_row_bounds(roots, self.n), roots)
+
+    def __reduce__(self):
+        return (RootIdeal, (list(self), self.n))
+
+    def _set_row_bounds(self, bounds, roots=None):
+        # Helper: remember the per-row intervals used for membership tests, falling back to a set of roots when the rows are not contiguous.
+        self._row_bounds = bounds
+        self._roots = frozenset(self if roots is None else roots) if bounds is None else None
+
+    def __contains__(self, root):
+        r""" Return whether ``root`` is in this root ideal.
+
+        This is a constant time lookup in the row intervals rather than a scan of the list of roots.
+
+        EXAMPLES::
+
+            sage: ri = RootIdeal([(0,4), (0,5), (0,6), (1,6)])
+            sage: (0, 5) in ri
+            True
+            sage: (1, 5) in ri
+            False
+        """
+        bounds = self._row_bounds
+        if bounds is None:
+            return root in self._roots
+        if not isinstance(root, tuple) or len(root) != 2:
+            return False
+        r, c = root
+        if not 0 <= r < len(bounds):
+            return False
+        start, stop = bounds[r]
+        return start <= c < stop
+
+    @lazy_attribute
+    def _down(self):
+        # Helper: ``_down[i]`` is :meth:`down` of row ``i``, computed once for all rows.
+        if self._row_bounds is not None:
+            return [start if start < stop else None for (start, stop) in self._row_bounds]
+        down = [None] * max([self.n] + [r + 1 for (r, c) in self])
+        for (r, c) in self:
+            if down[r] is None or c < down[r]:
+                down[r] = c
+        return down
+
+    @lazy_attribute
+    def _up(self):
+        # Helper: ``_up[j]`` is :meth:`up` of column ``j``, computed once for all columns.
+        n = self.n
+        up = [None] * n
+        bounds = self._row_bounds
+        if bounds is not None and all(stop == n for (start, stop) in bounds):
+            # the lowest row reaching column j is the lowest row starting at or before j
+            for r, (start, stop) in enumerate(bounds):
+                if start < stop:
+                    up[start] = r
+            for j in range(1, n):
+                if up[j] is None or (up[j - 1] is not None and up[j - 1] > up[j]):
+                    up[j] = up[j - 1]
+            return up
+        for (r, c) in self:
+            if up[c] is None or r > up[c]:
+                up[c] = r
+        return up
+
+    @lazy_attribute
+    def _bounce_path_heads(self):
+        # Helper: the indices that start a part of :meth:`down_path_column_lengths`, namely those not on the down path of a smaller index.
+        n = self.n
+        down = self._down
+        heads = []
+        used = [False] * n
+        for index in range(0, n):
+            if not used[index]:
+                heads.append(index)
+                # the rest of a used index's path is already used
+                while index is not None and not used[index]:
+                    used[index] = True
+                    index = down[index]
+        return heads
+
+    @lazy_attribute
+    def _bounce_path_incidence_matrix(self):
+        # Helper: the n x m 0/1 matrix whose h-th column marks the down path of the h-th bounce path head.
+        heads = self._bounce_path_heads
+        matrix = np.zeros((self.n, len(heads)), dtype=np.int64)
+        for h, head in enumerate(heads):
+            matrix[self.down_path(head), h] = 1
+        return matrix
 
     def __hash__(self):
         r""" Return the hash of this root ideal.
 
-        Thanks to this method, every :class:`RootIdeal` object is hashable, which is needed internally for other things to work.
+        Thanks to this method, every :class:`RootIdeal` object is hashable, which is needed internally for other things to work.  The hash is computed from the row intervals, and agrees with the hash of the :class:`FrozenRootIdeal` with the same roots.
 
         EXAMPLES::
 
             sage: ri = RootIdeal([(0,4), (0,5), (0,6), (1,6)])
-            sage: hash(ri)
-            6635400540396992191
+            sage: hash(ri) == hash(ri.freeze())
+            True
         """
-        return hash(tuple(self))
+        if self._row_bounds is None:
+            return hash(tuple(sorted(self)))
+        return hash(_row_bounds_key(self._row_bounds))
 
     def next_within_bounds(self, min=[], max=None, type='strict'):
         r"""Get the next root ideal lexicographically that contains min and is contained in max.
@@ -459,10 +761,9 @@ class RootIdeal(list):
 
             :meth:`up`, :meth:`down_path`, :meth:`up_path`, :meth:`top`, :meth:`bottom`
         """
-        # Note: I am assuming the cells in the root ideal are IN ORDER with y coordinates weakly increasing, and for fixed y, x strictly increasing
-        for (r, c) in ri:
-            if r == row_index:
-                return c
+        down = ri._down
+        if 0 <= row_index < len(down):
+            return down[row_index]
         return None
 
     def up(root_ideal, col_index):
@@ -497,9 +798,9 @@ class RootIdeal(list):
 
             :meth:`down`, :meth:`down_path`, :meth:`up_path`, :meth:`top`, :meth:`bottom`
         """
-        for (r, c) in reversed(root_ideal):
-            if c == col_index:
-                return r
+        up = root_ideal._up
+        if 0 <= col_index < len(up):
+            return up[col_index]
         return None
 
     def down_path(root_ideal, start_index):
@@ -695,19 +996,46 @@ class RootIdeal(list):
         if not self:
             mu = ptn
         else:
-            mu = []
             # n is the side length of the square
             n = self.n
-            indices_available = set(range(0, n))
-            for index in range(0, n):
-                if index in indices_available:
-                    # add the kthing to mu
-                    mu.append(self.down_path_column_lengths_part(ptn, index))
-                    # remove indices from future draws
-                    dpath = self.down_path(index)
-                    indices_available -= set(dpath)
+            down = self._down
+            # path_lengths[i] is down_path_column_lengths_part(ptn, i), built from the bottom since down[i] > i
+            path_lengths = [0] * n
+            for index in reversed(range(0, n)):
+                next_ = down[index]
+                path_lengths[index] = ptn[index] + (path_lengths[next_] if next_ is not None else 0)
+            mu = [path_lengths[head] for head in self._bounce_path_heads]
         return Partition(mu)
 
+    def down_path_column_lengths_many(self, ptns):
+        r""" Return the :meth:`down_path_column_lengths` of many partitions at once.
+
+        The bounce paths of the root ideal are recorded once in an incidence matrix, so that the column shapes of all the partitions come from a single integer matrix product.
+
+        INPUTS:
+
+        - ``ptns`` -- a 2-D array (or list of lists) of partitions, each padded with zeros to length ``n``
+
+        OUTPUT:
+
+        A 2-D NumPy array whose ``i``-th row is ``down_path_column_lengths(ptns[i])``, padded with zeros to a common length.
+
+        EXAMPLES::
+
+            sage: ri = RootIdeals().init_from_partition([5, 2, 2, 2], 6)
+            sage: ri.down_path_column_lengths_many([[7, 6, 5, 2, 2, 2], [3, 3, 2, 1, 0, 0]])
+            array([[15,  7,  4,  2],
+                   [ 6,  2,  1,  0]])
+
+        ..  SEEALSO::
+
+            :meth:`down_path_column_lengths`
+        """
+        ptns = np.asarray(ptns, dtype=np.int64)
+        if ptns.ndim != 2 or ptns.shape[1] != self.n:
+            raise ValueError('Expected a 2-D array of partitions padded to length {}.'.format(self.n))
+        return ptns.dot(self._bounce_path_incidence_matrix)
+
     def to_partition(root_ideal):
         r""" Given a root ideal (list of cells), return the corresponding partition (the row shape of the root ideal).
 
@@ -733,7 +1061,9 @@ class RootIdeal(list):
         """
         if root_ideal is None or root_ideal == False:
             return root_ideal
-        if not root_ideal:
+        if root_ideal._row_bounds is not None:
+            ptn = [stop - start for (start, stop) in root_ideal._row_bounds]
+        elif not root_ideal:
             ptn = []
         else:
             max_r = root_ideal[-1][0]
@@ -783,6 +1113,8 @@ class RootIdeal(list):
 
         Given a root ideal (or just an iterable of roots), return it's complement in the upper-staircase-shape, the result being a root ideal (or just an iterable of roots).
 
+        The complement of each row is found from the row intervals, but listing the roots of the result takes `O(n^2)` time.
+
         INPUTS:
 
         - ``ri`` -- a root ideal
@@ -819,6 +1151,21 @@ class RootIdeal(list):
             :meth:`RootIdeals.init_staircase`
         """
         n = self.n
+        if self._row_bounds is not None:
+            # complement each row interval inside the staircase row [i+1, n)
+            bounds = []
+            for i, (start, stop) in enumerate(self._row_bounds):
+                start, stop = max(start, i + 1), max(stop, i + 1)
+                if start >= stop:
+                    bounds.append((i + 1, n))
+                elif start == i + 1:
+                    bounds.append((stop, n))
+                elif stop == n:
+                    bounds.append((i + 1, start))
+                else:
+                    break
+            else:
+                return RootIdeal._from_row_bounds(bounds, n)
         ri_staircase = RootIdeals().init_staircase(n)
         ri_complement_set = set(ri_staircase) - set(self)
         ri_complement = RootIdeal(ri_complement_set, n)
@@ -844,11 +1191,184 @@ class RootIdeal(list):
             sage: all([RI.init_from_removable_roots(ideal.removable_roots(),5) == ideal for ideal in ideals])
             True
         """
+        if self._row_bounds is not None:
+            # only the first cell of each row can have nothing to its left
+            return set([(i, start) for i, (start, stop) in enumerate(self._row_bounds) if start < stop and (i + 1, start) not in self])
         return set([(i,j) for (i,j) in self if (i,j-1) not in self and (i+1,j) not in self])
 
     def addable_roots(self):
+        r"""
+        Give the set of all roots that, if added, would still yield a root ideal.
+
+        EXAMPLES::
+
+            sage: ri = RootIdeal([(0,2),(0,3),(1,3)],4)
+            sage: set(ri.addable_roots()) == set([(0, 1), (1, 2), (2, 3)])
+            True
+        """
+        n = self.n
+        if self._row_bounds is not None:
+            # in each row, only the root just left of the row's interval or the root in the last column can be added
+            roots = set()
+            for i, (start, stop) in enumerate(self._row_bounds):
+                for j in set([start - 1 if start < stop else n - 1, n - 1]):
+                    if i < j and (i, j) not in self and (i == 0 or (i - 1, j) in self) and (j + 1 == n or (i, j + 1) in self):
+                        roots.add((i, j))
+            return roots
         return set([(i,j) for (i,j) in self.complement() if ((i-1,j) in self or i==0) and ((i,j+1) in self or j+1==self.n)])
 
+    def _as_root_ideal(self, other):
+        # Helper: ``other`` as a :class:`RootIdeal` in the same grid as this one.
+        if isinstance(other, FrozenRootIdeal):
+            return other._list_view()
+        if isinstance(other, RootIdeal):
+            return other
+        return RootIdeal(other, self.n)
+
+    def _padded_partition(self):
+        # Helper: the row lengths of this root ideal padded with zeros to length n, checking that each row is right-justified.
+        n = self.n
+        bounds = self._row_bounds
+        if bounds is None or any(start < stop and stop != n for (start, stop) in bounds):
+            raise ValueError('{} is not a root ideal in the {} x {} grid.'.format(list(self), n, n))
+        return [stop - start for (start, stop) in bounds]
+
+    def _lattice_operand(self, other):
+        # Helper: the padded partitions of this root ideal and ``other``, which must be in the same grid.
+        other = self._as_root_ideal(other)
+        if other.n != self.n:
+            raise ValueError('The root ideals are in grids of different sizes {} and {}.'.format(self.n, other.n))
+        return self._padded_partition(), other._padded_partition()
+
+    def meet(self, other):
+        r""" Return the intersection of this root ideal and the root ideal ``other`` in the same `n` x `n` grid.
+
+        This is the componentwise minimum of the partitions of the two root ideals.  Comparing the partitions takes `O(n)` time, but listing the roots of the result takes `O(n^2)`.
+
+        EXAMPLES::
+
+            sage: RIS = RootIdeals()
+            sage: RIS.init_from_partition([3, 1], 5).meet(RIS.init_from_partition([2, 2, 1], 5))
+            [(0, 3), (0, 4), (1, 4)]
+
+        ..  SEEALSO::
+
+            :meth:`join`, :meth:`contains`
+        """
+        n = self.n
+        ptn, other_ptn = self._lattice_operand(other)
+        return RootIdeal._from_row_bounds([(n - min(part, other_part), n) for part, other_part in zip(ptn, other_ptn)], n)
+
+    def join(self, other):
+        r""" Return the union of this root ideal and the root ideal ``other`` in the same `n` x `n` grid.
+
+        This is the componentwise maximum of the partitions of the two root ideals.  Comparing the partitions takes `O(n)` time, but listing the roots of the result takes `O(n^2)`.
+
+        EXAMPLES::
+
+            sage: RIS = RootIdeals()
+            sage: RIS.init_from_partition([3, 1], 5).join(RIS.init_from_partition([2, 2, 1], 5))
+            [(0, 2), (0, 3), (0, 4), (1, 3), (1, 4), (2, 4)]
+
+        ..  SEEALSO::
+
+            :meth:`meet`, :meth:`contains`
+        """
+        n = self.n
+        ptn, other_ptn = self._lattice_operand(other)
+        return RootIdeal._from_row_bounds([(n - max(part, other_part), n) for part, other_part in zip(ptn, other_ptn)], n)
+
+    def contains(self, other):
+        r""" Return whether every root of ``other`` is a root of this root ideal.
+
+        This compares the rows of the two root ideals in `O(n)` time, without building sets of roots.
+
+        EXAMPLES::
+
+            sage: RIS = RootIdeals()
+            sage: RIS.init_from_partition([3, 1], 5).contains(RIS.init_from_partition([2, 1], 5))
+            True
+            sage: RIS.init_from_partition([3, 1], 5).contains(RIS.init_from_partition([2, 2], 5))
+            False
+
+        ..  SEEALSO::
+
+            :meth:`covers`
+        """
+        other = self._as_root_ideal(other)
+        bounds = self._row_bounds
+        other_bounds = other._row_bounds
+        if bounds is None or other_bounds is None:
+            return all(root in self for root in other)
+        for r, (other_start, other_stop) in enumerate(other_bounds):
+            if other_start < other_stop:
+                if r >= len(bounds):
+                    return False
+                start, stop = bounds[r]
+                if not start <= other_start or not other_stop <= stop:
+                    return False
+        return True
+
+    def covers(self, other):
+        r""" Return whether this root ideal is obtained from ``other`` by adding a single root.
+
+        EXAMPLES::
+
+            sage: RIS = RootIdeals()
+            sage: RIS.init_from_partition([3, 1], 5).covers(RIS.init_from_partition([2, 1], 5))
+            True
+            sage: RIS.init_from_partition([3, 1], 5).covers(RIS.init_from_partition([2], 5))
+            False
+
+        ..  SEEALSO::
+
+            :meth:`contains`, :meth:`addable_roots`
+        """
+        other = self._as_root_ideal(other)
+        return len(self) == len(other) + 1 and self.contains(other)
+
+    def freeze(self):
+        r""" Return the :class:`FrozenRootIdeal` with the same roots.
+
+        EXAMPLES::
+
+            sage: ri = RootIdeal([(0,4), (0,5), (0,6), (1,6)])
+            sage: ri.freeze() == ri and hash(ri.freeze()) == hash(ri)
+            True
+        """
+        ptn = Partition(self._padded_partition())
+        return FrozenRootIdeal._from_partition(tuple(ptn), self.n)
+
+    def to_dyck_word(self):
+        r""" Return the Dyck word of this root ideal, packed into an integer.
+
+        Row `i` of a root ideal in the `n` x `n` grid starts in some column `c_i` (or `c_i = n` if the row is empty), where `i < c_i` and `c_0 \leq c_1 \leq \cdots \leq c_{n-1} = n`.  Reading the rows from the top, write a ``1`` for every step that `c_i` increases and then a ``0`` for the row.  This is a Dyck word of semilength `n`, and the bits are packed with the first letter as the most significant bit.
+
+        EXAMPLES::
+
+            sage: bin(RootIdeal([], n=3).to_dyck_word())
+            '0b111000'
+            sage: bin(RootIdeals().init_staircase(3).to_dyck_word())
+            '0b101010'
+            sage: bin(RootIdeals().init_from_partition([2], 4).to_dyck_word())
+            '0b11011000'
+
+        ..  SEEALSO::
+
+            :meth:`RootIdeals.init_from_dyck_word`, :func:`dyck_word_rank`
+        """
+        n = self.n
+        bounds = self._row_bounds
+        if bounds is None or any(start < stop and (stop != n or start <= i) for i, (start, stop) in enumerate(bounds)) or any(bounds[i][0] > bounds[i + 1][0] for i in range(n - 1)):
+            raise ValueError('{} is not a root ideal in the {} x {} grid.'.format(list(self), n, n))
+        word = 0
+        previous_start = 0
+        for (start, stop) in bounds:
+            ups = start - previous_start
+            word = (((word << ups) | ((1 << ups) - 1)) << 1)
+            previous_start = start
+        return word
+
     def root_vectors(self):
         def ij(i, j, l):
             seq = [0] * l
@@ -858,6 +1378,32 @@ class RootIdeal(list):
             return seq
         VS = VectorSpace(QQ,self.n)
         return [VS(ij(i,j,self.n)) for (i,j) in self]
+
+    def root_vector_matrix(self, format='sage'):
+        r""" Return the root vectors of this root ideal as the rows of a sparse integer matrix.
+
+        The root `(i, j)` gives the row `e_i - e_j`, as in :meth:`root_vectors`, but no vectors are allocated.
+
+        OPTIONAL INPUTS:
+
+        - ``format`` -- (default ``'sage'``) ``'sage'`` for a sparse Sage matrix over ``ZZ``, or ``'numpy'`` for the CSR arrays ``(data, indices, indptr)`` of the matrix, as accepted by ``scipy.sparse.csr_matrix``
+
+        EXAMPLES::
+
+            sage: ri = RootIdeal([(0,2), (0,3), (1,3)])
+            sage: ri.root_vector_matrix()
+            [ 1  0 -1  0]
+            [ 1  0  0 -1]
+            [ 0  1  0 -1]
+            sage: data, indices, indptr = ri.root_vector_matrix(format='numpy')
+            sage: indices
+            array([0, 2, 0, 3, 1, 3])
+
+        ..  SEEALSO::
+
+            :meth:`root_vectors`, :func:`root_ideals_to_root_vector_matrix`
+        """
+        return _root_vector_matrix(list(self), self.n, format)
             
     def _latex_(self, color='red', index=None):
         r"""
@@ -879,34 +1425,152 @@ class RootIdeal(list):
             \end{ytableau}
         """
         # these allow the view command to work (maybe move them somewhere more appropriate?)
-        if index:
-            assert len(index) == self.n, "Length of root ideal index must equal root ideal size!"
-        from sage.misc.latex import latex            
-        latex.add_to_mathjax_avoid_list('ytableau')
-        latex.add_package_to_preamble_if_available('ytableau')
-        begin = "\\begin{ytableau}\n"
-        entries = ""
-        for i in range(self.n):
-            entries += "  "
-            for j in range(self.n):
-                if (i,j) in self:
-                    entries += "*("+color+") & "
-                elif index and i == j:
-                    entries += str(index[i]) + " & "
-                else:
-                    entries += "{} & "
-            entries = entries[:-2]
-            if i != self.n-1:
-                entries += "\\\\ \n"
-        end = "\n\\end{ytableau}"
-        return begin+entries+end    
+        _setup_ytableau_latex()
+        return _ytableau_code(self, color, index)
+
+
+def _root_ideal_mutator(name):
+    # Helper: wrap the list method ``name`` so that it keeps the row intervals of a :class:`RootIdeal` up to date.
+    method = getattr(list, name)
+
+    def mutator(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._roots_changed()
+        return result
+    mutator.__name__ = name
+    mutator.__doc__ = method.__doc__
+    return mutator
+
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse', '__setitem__', '__delitem__', '__setslice__', '__delslice__', '__iadd__', '__imul__'):
+    if hasattr(list, _name):
+        setattr(RootIdeal, _name, _root_ideal_mutator(_name))
+
+
+class FrozenRootIdeal(object):
+    r""" An immutable root ideal.
+
+    A :class:`RootIdeal` is a mutable list, so it should not be used as a dictionary key.  A frozen root ideal stores only the side length `n` and the partition of the root ideal (see :meth:`RootIdeal.to_partition`), computes its hash once, and compares by that partition.  It is equal to, and hashes the same as, the :class:`RootIdeal` with the same roots.  All the non-mutating methods of :class:`RootIdeal` are available.
+
+    EXAMPLES::
+
+        sage: ri = RootIdeals(frozen=True).init_from_partition([3, 1], 7)
+        sage: ri
+        [(0, 4), (0, 5), (0, 6), (1, 6)]
+        sage: ri == RootIdeal([(0,4), (0,5), (0,6), (1,6)])
+        True
+        sage: {ri: 1}[RootIdeal([(0,4), (0,5), (0,6), (1,6)]).freeze()]
+        1
+        sage: ri.thaw().down_path(0)
+        [0, 4]
+    """
+    __slots__ = ('n', '_partition', '_hash', '_view')
+
+    def __init__(self, lis, n=None):
+        ri = lis if isinstance(lis, RootIdeal) and n is None else RootIdeal(lis, n)
+        self._set(ri.freeze()._partition, ri.n)
+
+    @classmethod
+    def _from_partition(cls, ptn, n):
+        # Helper: build a frozen root ideal directly from the tuple ``ptn`` of its row lengths.
+        ri = cls.__new__(cls)
+        ri._set(ptn, n)
+        return ri
+
+    def _set(self, ptn, n):
+        # Helper: the slots may only be set here.
+        object.__setattr__(self, 'n', n)
+        object.__setattr__(self, '_partition', ptn)
+        object.__setattr__(self, '_view', None)
+        object.__setattr__(self, '_hash', hash(tuple((n - part, n) for part in ptn)))
+
+    def _list_view(self):
+        # Helper: the :class:`RootIdeal` with the same roots, built on first use.
+        if self._view is None:
+            n = self.n
+            bounds = [(n - part, n) for part in self._partition] + [(n, n)] * (n - len(self._partition))
+            object.__setattr__(self, '_view', RootIdeal._from_row_bounds(bounds, n))
+        return self._view
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FrozenRootIdeal is immutable.')
+
+    def __reduce__(self):
+        return (FrozenRootIdeal, (list(self), self.n))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenRootIdeal):
+            # the roots determine n unless there are none
+            return self._hash == other._hash and self._partition == other._partition and (self.n == other.n or not self._partition)
+        if isinstance(other, list):
+            return list.__eq__(self._list_view(), other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __contains__(self, root):
+        if not isinstance(root, tuple) or len(root) != 2:
+            return False
+        r, c = root
+        return 0 <= r < len(self._partition) and self.n - self._partition[r] <= c < self.n
+
+    def __iter__(self):
+        return iter(self._list_view())
+
+    def __len__(self):
+        return sum(self._partition)
+
+    def __getitem__(self, index):
+        return self._list_view()[index]
+
+    def __repr__(self):
+        return list.__repr__(self._list_view())
+
+    def __getattr__(self, name):
+        # the read-only methods of RootIdeal act on the list view, but the list methods which mutate it are not available
+        if name.startswith('__') or name in FrozenRootIdeal.__slots__ or (hasattr(list, name) and name not in ('count', 'index')):
+            raise AttributeError(name)
+        return getattr(self._list_view(), name)
+
+    def to_partition(self):
+        r""" Return the partition of this root ideal, as in :meth:`RootIdeal.to_partition`.
+
+        EXAMPLES::
+
+            sage: RootIdeals(frozen=True).init_from_partition([5, 2, 2, 2], 6).to_partition()
+            [5, 2, 2, 2]
+        """
+        return Partition(self._partition)
+
+    def freeze(self):
+        return self
+
+    def thaw(self):
+        r""" Return a mutable :class:`RootIdeal` with the same roots.
+        """
+        return RootIdeal(self._list_view(), self.n)
+
 
 class RootIdeals:
     r""" The family of root ideals.
 
     Use this class as a factory to initialize a :class:`RootIdeal` object with any valid identifying data.  See the ``init_from...`` methods below for ways to create a root ideal.  Remember that you can also create a root ideal directly from an iterable of roots using :class:`RootIdeal`.
+
+    Use ``RootIdeals(frozen=True)`` to get :class:`FrozenRootIdeal` objects instead, for example to use them as dictionary keys.
     """
 
+    def __init__(self, frozen=False):
+        self.frozen = frozen
+
+    def _output(self, ri):
+        # Helper: return the root ideal ``ri`` in the form this factory was asked for.
+        return ri.freeze() if self.frozen else ri
+
     def init_from_removable_roots(self, corners, n):
         r""" Given the removable roots ``corners`` of a root ideal and the size length `n` of the `n` x `n` grid, return the root ideal itself.
 
@@ -950,7 +1614,7 @@ class RootIdeals:
         if algorithm == 'removable roots':
             corners = skew_partition_to_removable_roots(sp, type)
             n = len(sp.outer())
-            root_ideal = self.init_from_removable_roots(corners, n)
+            return self.init_from_removable_roots(corners, n)
         elif algorithm == 'bounce':
             if type != 'max':
                 raise Exception(
@@ -959,9 +1623,9 @@ class RootIdeals:
             n = len(sp.outer())
             root_ideal = selected_rows_to_maximum_root_ideal(
                 n, selected_indices)
+            return self._output(root_ideal)
         else:
             raise ValueError('The requested algorithm "{}" does not exist.'.format(algorithm))
-        return RootIdeal(root_ideal)
 
     def init_all_from_skew_partition(self, sp, type='strict'):
         r""" Given a :class:`SkewPartition` ``sp``, find the corresponding set (but given as a list here) of root ideals.
@@ -978,14 +1642,80 @@ class RootIdeals:
 
             :meth:`init_from_skew_partition`
         """
-        # We could change this to an iterator if users may not want all the root ideals.
-        min_ri = self.init_from_skew_partition(sp, type='min')
-        max_ri = self.init_from_skew_partition(sp, type='max')
+        return list(self.iter_all_from_skew_partition(sp, type=type))
+
+    def _skew_partition_interval(self, sp, type):
+        # Helper: return ``(n, lower, upper, is_strict)`` where ``lower`` and ``upper`` are the partitions of the min and max root ideals of ``sp``, both padded with zeros to the length of ``upper``.
+        if type in ('strict', 'rational', 'strictly decreasing'):
+            is_strict = True
+        elif type in (None, 'weak', 'weakly decreasing'):
+            is_strict = False
+        else:
+            raise ValueError('Unrecognized partition type.')
         n = len(sp.outer())
+        lower = list(self.init_from_skew_partition(sp, type='min').to_partition())
+        upper = list(self.init_from_skew_partition(sp, type='max').to_partition())
+        lower += [0] * (len(upper) - len(lower))
+        return n, lower, upper, is_strict
 
-        def next_func(ri): return ri.next_within_bounds(min=min_ri, max=max_ri, type=type)
-        ris = _generate_path(next_func, min_ri)
-        return ris
+    def iter_all_from_skew_partition(self, sp, type='strict'):
+        r""" Iterate over the root ideals of :meth:`init_all_from_skew_partition`, in the same order.
+
+        The root ideals are generated from their partitions, which are stepped through as plain lists of integers between the partitions of the min and max root ideals, in the same way as :meth:`RootIdeal.next_within_bounds`.
+
+        EXAMPLES::
+
+            sage: sp = SkewPartition([[4, 2, 1, 1], [2, 1]])
+            sage: list(RootIdeals().iter_all_from_skew_partition(sp))
+            [[(0, 1), (0, 2), (0, 3), (1, 3)], [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3)]]
+
+        ..  SEEALSO::
+
+            :meth:`init_all_from_skew_partition`, :meth:`count_all_from_skew_partition`
+        """
+        n, lower, upper, is_strict = self._skew_partition_interval(sp, type)
+        # the largest value allowed in row r is upper[r], and also below ptn[r-1] (strict) or at most ptn[r-1] (weak)
+        gap = 1 if is_strict else 0
+        ptn = list(lower)
+        while True:
+            yield self._output(RootIdeal._from_row_bounds([(n - part, n) for part in ptn] + [(n, n)] * (n - len(ptn)), n))
+            for r in range(len(ptn) - 1, -1, -1):
+                if ptn[r] < upper[r] and (r == 0 or ptn[r] < ptn[r-1] - gap):
+                    ptn[r] += 1
+                    break
+                ptn[r] = lower[r]
+            else:
+                return
+
+    def count_all_from_skew_partition(self, sp, type='strict'):
+        r""" Return the number of root ideals in :meth:`init_all_from_skew_partition` without generating them.
+
+        Row ``r`` of the partition of such a root ideal takes every value from ``lower[r]`` up to the smaller of ``upper[r]`` and (for strict type) one less than row ``r-1``, where ``lower`` and ``upper`` are the partitions of the min and max root ideals.  The count of these lattice paths is found by dynamic programming, one row at a time.
+
+        EXAMPLES::
+
+            sage: sp = SkewPartition([[4, 2, 1, 1], [2, 1]])
+            sage: RootIdeals().count_all_from_skew_partition(sp)
+            2
+
+        ..  SEEALSO::
+
+            :meth:`iter_all_from_skew_partition`
+        """
+        n, lower, upper, is_strict = self._skew_partition_interval(sp, type)
+        gap = 1 if is_strict else 0
+        # counts[v] is the number of ways to fill the rows below the current one, given that the current row has value v
+        counts = [1] * (n + 1)
+        for r in range(len(upper) - 1, 0, -1):
+            # prefix[v] is the sum of counts[lower[r]:v]
+            prefix = [0] * (n + 2)
+            for v in range(n + 1):
+                prefix[v + 1] = prefix[v] + (counts[v] if v >= lower[r] else 0)
+            # given row r-1 has value v, row r ranges over [lower[r], max(lower[r], min(upper[r], v - gap))]
+            counts = [prefix[max(lower[r], min(upper[r], v - gap)) + 1] for v in range(n + 1)]
+        if not upper:
+            return 1
+        return sum(counts[v] for v in range(lower[0], upper[0] + 1))
 
     def init_k_schur_from_pseudo_partition(self, seq, k, n=None):
         r""" Given a ``k``-bounded "pseudo-partition" ``seq`` `= \mu` and the dimension `n` of the `n` x `n` grid, return the corresponding `k`-Schur root ideal `\Delta^k(\mu)`, as defined in [cat]_ Definition 2.2 as
@@ -1022,7 +1752,7 @@ class RootIdeals:
         ri = []
         for i, part in enumerate(seq):
             ri += [(i, j) for j in range(k - part + i + 1, n)]
-        return RootIdeal(ri)
+        return self._output(RootIdeal(ri))
 
     def init_from_partition(self, ptn, n):
         r""" Given a partition and the size of the square, return the corresponding root ideal.  (This is the inverse function to :meth:`RootIdeal.to_partition` in the context of an `n` x `n` grid.)
@@ -1043,10 +1773,44 @@ class RootIdeals:
         if ptn is None or ptn == False:
             return ptn
         ptn = Partition(ptn)
+        if len(ptn) <= n and (not ptn or ptn[0] <= n):
+            bounds = [(n - part, n) for part in ptn] + [(n, n)] * (n - len(ptn))
+            return self._output(RootIdeal._from_row_bounds(bounds, n))
         root_ideal = []
         for r, part in enumerate(ptn):
             root_ideal += [(r, c) for c in range(n-part, n)]
-        return RootIdeal(root_ideal)
+        return self._output(RootIdeal(root_ideal))
+
+    def init_from_dyck_word(self, word, n=None):
+        r""" Given a Dyck word packed into an integer (see :meth:`RootIdeal.to_dyck_word`), return the corresponding root ideal.
+
+        The semilength ``n`` defaults to half the bit length of ``word``, since a Dyck word always starts with a ``1``.
+
+        EXAMPLES::
+
+            sage: RootIdeals().init_from_dyck_word(0b11011000)
+            [(0, 2), (0, 3)]
+            sage: RootIdeals().init_from_dyck_word(0b101010)
+            [(0, 1), (0, 2), (1, 2)]
+
+        ..  SEEALSO::
+
+            :meth:`RootIdeal.to_dyck_word`, :func:`dyck_word_unrank`
+        """
+        if n is None:
+            n = word.bit_length() // 2
+        bounds = []
+        start = 0
+        for position in range(2 * n - 1, -1, -1):
+            if (word >> position) & 1:
+                start += 1
+            else:
+                if start <= len(bounds):
+                    raise ValueError('{} is not a Dyck word of semilength {}.'.format(bin(word), n))
+                bounds.append((start, n))
+        if start != n or len(bounds) != n or word >> (2 * n):
+            raise ValueError('{} is not a Dyck word of semilength {}.'.format(bin(word), n))
+        return self._output(RootIdeal._from_row_bounds(bounds, n))
 
     def init_staircase(self, n):
         r""" Given `n`, return the root ideal commonly denoted `\Delta^+`, which is the maximum possible root ideal in an `n` x `n` grid.
@@ -1091,15 +1855,127 @@ class RootIdeals:
         assert all(term >= 1 for term in composition)
         if isinstance(composition, (Partition, Composition)):
             composition = list(composition)
-        cells_complement = []
-        index_previous = -1
-        for term in composition:
-            indices = range(index_previous + 1, index_previous + 1 + term)
-            for index in indices:
-                cells = [(index, j) for j in range(index + 1, indices[-1] + 1)]
-                cells_complement += cells
-            index_previous = indices[-1]
         n = sum(composition)
-        complement_ri = RootIdeal(cells_complement, n)
-        ri = complement_ri.complement()
-        return ri
+        # every row of a block starts just right of the block
+        bounds = []
+        block_end = 0
+        for term in composition:
+            block_end += term
+            bounds += [(block_end, n)] * term
+        return self._output(RootIdeal._from_row_bounds(bounds, n))
+
+
+# DYCK WORDS
+
+
+@cached_function
+def _dyck_completions(n):
+    # Helper: ``table[u][d]`` is the number of ways to finish a Dyck word of semilength ``n`` whose prefix has ``u`` ones and ``d`` zeros (``d <= u <= n``).
+    table = [[0] * (n + 1) for _ in range(n + 1)]
+    for u in range(n, -1, -1):
+        for d in range(u, -1, -1):
+            if u == n:
+                table[u][d] = 1
+            else:
+                table[u][d] = table[u + 1][d] + (table[u][d + 1] if d < u else 0)
+    return table
+
+
+def dyck_word_rank(word, n=None):
+    r""" Return the position of the Dyck word ``word`` among all Dyck words of semilength ``n`` in increasing order.
+
+    The words are packed into integers as in :meth:`RootIdeal.to_dyck_word`, so ranks run from ``0`` to ``catalan_number(n) - 1`` and the root ideals of the `n` x `n` grid can be stored as their ranks.
+
+    EXAMPLES::
+
+        sage: [dyck_word_rank(word) for word in iter_dyck_words(3)]
+        [0, 1, 2, 3, 4]
+        sage: dyck_word_rank(RootIdeals().init_staircase(3).to_dyck_word())
+        0
+
+    ..  SEEALSO::
+
+        :func:`dyck_word_unrank`, :func:`iter_dyck_words`
+    """
+    if n is None:
+        if word.bit_length() % 2:
+            raise ValueError('{} is not a Dyck word.'.format(bin(word)))
+        n = word.bit_length() // 2
+    if word >> (2 * n):
+        raise ValueError('{} is not a Dyck word of semilength {}.'.format(bin(word), n))
+    table = _dyck_completions(n)
+    rank = 0
+    ups = downs = 0
+    for position in range(2 * n - 1, -1, -1):
+        if (word >> position) & 1:
+            if ups == n:
+                raise ValueError('{} is not a Dyck word of semilength {}.'.format(bin(word), n))
+            # every word with a 0 here comes first
+            if downs < ups:
+                rank += table[ups][downs + 1]
+            ups += 1
+        else:
+            if downs == ups:
+                raise ValueError('{} is not a Dyck word of semilength {}.'.format(bin(word), n))
+            downs += 1
+    return rank
+
+
+def dyck_word_unrank(rank, n):
+    r""" Return the Dyck word of semilength ``n`` whose :func:`dyck_word_rank` is ``rank``.
+
+    EXAMPLES::
+
+        sage: [bin(dyck_word_unrank(rank, 3)) for rank in range(5)]
+        ['0b101010', '0b101100', '0b110010', '0b110100', '0b111000']
+        sage: RootIdeals().init_from_dyck_word(dyck_word_unrank(4, 3))
+        []
+
+    ..  SEEALSO::
+
+        :func:`dyck_word_rank`, :meth:`RootIdeals.init_from_dyck_word`
+    """
+    table = _dyck_completions(n)
+    if not 0 <= rank < table[0][0]:
+        raise ValueError('The rank must be between 0 and {}.'.format(table[0][0] - 1))
+    word = 0
+    ups = downs = 0
+    for _ in range(2 * n):
+        if downs < ups and (ups == n or rank < table[ups][downs + 1]):
+            word <<= 1
+            downs += 1
+        else:
+            if downs < ups:
+                rank -= table[ups][downs + 1]
+            word = (word << 1) | 1
+            ups += 1
+    return word
+
+
+def iter_dyck_words(n):
+    r""" Iterate over the Dyck words of semilength ``n``, packed into integers in increasing order.
+
+    These encode all the root ideals of the `n` x `n` grid (see :meth:`RootIdeal.to_dyck_word`).  For ``n`` up to 31 the words fit in 64 bits, so they can be collected with ``numpy.fromiter(iter_dyck_words(n), dtype=numpy.int64)``.
+
+    EXAMPLES::
+
+        sage: [bin(word) for word in iter_dyck_words(3)]
+        ['0b101010', '0b101100', '0b110010', '0b110100', '0b111000']
+        sage: [RootIdeals().init_from_dyck_word(word) for word in iter_dyck_words(2)]
+        [[(0, 1)], []]
+
+    ..  SEEALSO::
+
+        :func:`dyck_word_rank`, :func:`dyck_word_unrank`
+    """
+    # depth-first search, trying 0 before 1 so that the words come out in increasing order
+    stack = [(0, 0, 0)]
+    while stack:
+        word, ups, downs = stack.pop()
+        if downs == n:
+            yield word
+            continue
+        if ups < n:
+            stack.append(((word << 1) | 1, ups + 1, downs))
+        if downs < ups:
+            stack.append((word << 1, ups, downs + 1))
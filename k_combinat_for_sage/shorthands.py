@@ -7,7 +7,7 @@ from all import *
 # ^*^ sphinx insert ^*^
 
 # pre-initialized useful variables
-Sym = SymmetricFunctions(QQ['t'])
+Sym = symmetric_function_bases(QQ['t']).sym
 Sym.inject_shorthands()  # creates s, h, etc
 
 # shorter names for certain functions
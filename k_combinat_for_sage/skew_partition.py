@@ -24,9 +24,9 @@ from sage.all import *
 
 parent_module = sys.modules['.'.join(__name__.split('.')[:-1]) or '__main__']
 if __name__ == '__main__' or parent_module.__name__ == '__main__':
-    from partition import is_weakly_decreasing
+    from partition import is_weakly_decreasing, k_profile
 else:
-    from .partition import is_weakly_decreasing
+    from .partition import is_weakly_decreasing, k_profile
 # ^*^ sphinx insert ^*^
 
 
@@ -292,8 +292,9 @@ def is_k_boundary(sp, k=None):
         :meth:`Partition.k_boundary`
     """
     if k is None:
-        max_hook_length = sp.outer().hook_length(0, 0)
-        return any(is_k_boundary(sp, k_star) for k_star in range(0, max_hook_length+1))
+        # sp is a k-boundary exactly when its row lengths are the k-row-shape of its outer shape
+        row_lengths = sp.row_lengths()
+        return any(entry['k_row_lengths'] == row_lengths for entry in k_profile(sp.outer()))
     elif k == 0:
         # the only valid 0-boundary is the empty shape
         return sp.outer() == sp.inner()
@@ -152,14 +152,19 @@ def std_strong_tab_from_core_sequence(core_sequence, k, markings):
     # 'markings' are (row,col) coordinates
     if len(core_sequence) == 0:
         return StrongTableaux(k, [], []).an_element()
+    # The rows are allocated once at their final lengths, each cover fills in its cells from the row length differences, and the markings are negated in place, so that the StrongTableau is created only once.
     wt = [1]*(len(core_sequence)-1)
-    core_zero = core_sequence[0]
-    base = Tableau([[None]*i for i in core_zero])
+    rows = [[None] * row_length for row_length in core_sequence[-1]]
     for core_index in range(1, len(core_sequence)):
-        skew = shape_to_homogeneous_tab(
-            core_sequence[core_index], core_index, core_sequence[core_index-1])
-        base = add_skew_tab_to_tab(base, skew)
-    return StrongTableaux.add_marking(base, markings, k, wt)
+        inner_core = core_sequence[core_index - 1]
+        for row_index, row_length in enumerate(core_sequence[core_index]):
+            inner_row_length = inner_core[row_index] if row_index < len(inner_core) else 0
+            row = rows[row_index]
+            for col_index in range(inner_row_length, row_length):
+                row[col_index] = core_index
+    for row_index, col_index in markings:
+        rows[row_index][col_index] = -rows[row_index][col_index]
+    return StrongTableau(rows, k, wt)
 
 
 def _strong_marked_tableau(lis, k):
@@ -197,9 +202,18 @@ def k_coverees1(root, k):
     return coverees
 
 
-def k_coverees(core, k, algorithm=1):
-    # THIS FUNCTIONALITY IS ALREADY BUILTIN.  See algorithm 2 below.
-    r""" Given a `k+1`-core, find all sub-`k+1`-cores that have `k`-boundary 1 less than the given. """
+def k_coverees(core, k, algorithm=3):
+    r""" Given a `k+1`-core, find all sub-`k+1`-cores that have `k`-boundary 1 less than the given.
+
+    OPTIONAL INPUTS:
+
+    - ``algorithm`` -- (default ``3``) ``1`` removes cells recursively and filters the resulting partitions, ``2`` uses :meth:`Core.strong_down_list`, and ``3`` works on the `k+1`-runner abacus (see :meth:`abacus_strong_down_list`), which does not depend on the size of ``core``.
+
+    EXAMPLES::
+
+        sage: k_coverees([2, 1, 1], 2)
+        {[1, 1], [2]}
+    """
     if algorithm == 1:
         return k_coverees1(core, k)
     elif algorithm == 2:
@@ -207,12 +221,17 @@ def k_coverees(core, k, algorithm=1):
         coveree_core_list = core.strong_down_list()
         coverees = set(c.to_partition() for c in coveree_core_list)
         return coverees
+    elif algorithm == 3:
+        abacus = k_core_to_abacus(core, k+1)
+        coverees = set(abacus_to_k_core(a) for a in abacus_strong_down_list(abacus))
+        return coverees
     else:
         raise ValueError('Unknown algorithm.')
 
 
 def __go_to_ribbon_head(cells, start_cell):
     # Given the cells of a ribbon or multiple disconnected ribbons, and a starting point, find the head of the ribbon
+    cells = set(cells)
     if start_cell not in cells:
         raise ValueError('Starting position is not in list of cells.')
     cell = start_cell
@@ -231,6 +250,33 @@ def __go_to_ribbon_head(cells, start_cell):
     return head
 
 
+def markings_by_row(outer_core, inner_core):
+    r""" Return all the markings of the skew shape ``outer_core`` / ``inner_core`` at once.
+
+    A row has a marking when the ribbon walk of :meth:`row_marking_to_marking` from the rightmost cell of that row stays in the row, which happens exactly when the row is not empty and the previous row of ``inner_core`` is at least as long as the row of ``outer_core``.  This is checked for every row directly from the row lengths, without building any cells.
+
+    OUTPUT:
+
+    A dictionary mapping each row index which has a marking to the marking `(\text{row index}, \text{column index})`.
+
+    EXAMPLES:
+
+    The skew shape [3, 2, 2] / [2, 1] has markings in rows `0` and `1`, but not in row `2`::
+
+        sage: markings_by_row([3, 2, 2], [2, 1])
+        {0: (0, 2), 1: (1, 1)}
+
+    ..  SEEALSO::
+
+        :meth:`row_marking_to_marking`, :meth:`is_row_markable`
+    """
+    outer = list(outer_core)
+    inner = list(inner_core)
+    inner += [0] * (len(outer) - len(inner))
+    return dict((r, (r, outer[r] - 1)) for r in range(len(outer))
+                if inner[r] < outer[r] and (r == 0 or inner[r - 1] >= outer[r]))
+
+
 def row_marking_to_marking(outer_core, inner_core, row_marking):
     r""" Convert a row marking to a marking.
 
@@ -268,17 +314,10 @@ def row_marking_to_marking(outer_core, inner_core, row_marking):
 
         :meth:`row_markings_to_markings`
     """
-    sp = SkewPartition([outer_core, inner_core])
-    cells = sp.cells()
-    row_indices = set(cell[0] for cell in cells)
-    if row_marking not in row_indices:
-        raise ValueError('no such row marking')
-    start_cell = (row_marking, skew_partition.right(sp, row_marking))
-    head = __go_to_ribbon_head(cells, start_cell)
-    if head[0] == row_marking:
-        return head
-    else:
+    markings = markings_by_row(outer_core, inner_core)
+    if row_marking not in markings:
         raise ValueError('no such row marking')
+    return markings[row_marking]
 
 
 def row_markings_to_markings(core_sequence, row_markings):
@@ -345,13 +384,9 @@ def is_row_markable(outer_core, inner_core, row_marking):
 
     ..  SEEALSO::
 
-        :meth:`strong_tableau_has_row_marking`
+        :meth:`strong_tableau_has_row_marking`, :meth:`markings_by_row`
     """
-    try:
-        row_marking_to_marking(outer_core, inner_core, row_marking)
-        return True
-    except ValueError:
-        return False
+    return row_marking in markings_by_row(outer_core, inner_core)
 
 
 def k_marked_coverees(core, k, row_marking):
@@ -385,10 +420,123 @@ def k_marked_coverees(core, k, row_marking):
         sage: k_marked_coverees([6, 4, 2, 2, 1], 5, 4)
         {[6, 3, 2, 2]}
     """
-    coverees = k_coverees(core, k)
-    marked_coverees = [c for c in coverees
-                       if is_row_markable(core, c, row_marking)]
-    return set(marked_coverees)
+    return set(iter_k_marked_coverees(core, k, row_marking))
+
+
+def iter_k_marked_coverees(core, k, row_marking):
+    r""" Iterate over the `k+1`-cores covered by the `k+1`-core ``core`` with the given ``row_marking``.
+
+    Same as :meth:`k_marked_coverees`, except that the coverees are generated one at a time, and only the covers marked in row ``row_marking`` are ever built.  The marked ribbon head is the last cell of row ``row_marking``, so its `k+1`-residue is the runner of the bead which must move on the `k+1`-runner abacus (see :meth:`abacus_marked_strong_down_list`).
+
+    EXAMPLES::
+
+        sage: sorted(iter_k_marked_coverees([6, 4, 2, 2, 1], 5, 1))
+        [[6, 2, 2, 2, 1], [6, 3, 2, 2]]
+        sage: list(iter_k_marked_coverees([6, 4, 2, 2, 1], 5, 2))
+        []
+
+    ..  SEEALSO::
+
+        :meth:`k_marked_coverees`, :meth:`markings_by_row`
+    """
+    core = Partition(core)
+    if row_marking >= len(core):
+        return
+    abacus = k_core_to_abacus(core, k+1)
+    num_beads_per_runner = -(-len(core) // (k+1))
+    bead = core[row_marking] + num_beads_per_runner * (k+1) - 1 - row_marking
+    runner = bead % (k+1)
+    depth = abacus[runner] + num_beads_per_runner - bead // (k+1)
+    for new_abacus in abacus_marked_strong_down_list(abacus, runner, depth):
+        yield abacus_to_k_core(new_abacus)
+
+
+def _marked_core_sequence_dag(end_core, k, row_markings):
+    # Build the DAG whose nodes at level i are the cores which can appear at position i of a marked core sequence ending in end_core.
+    # Returns (levels, counts), where levels[i] maps each core at level i to the list of its marked coverees at level i-1, and counts[i] maps each core at level i to the number of marked core sequences from level 0 up to it.  Cores which cannot be reached from level 0 are dropped.
+    # check inputs
+    k = NonNegativeIntegerSemiring()(k)
+    end_core = Core(end_core, k+1)
+    end_core = end_core.to_partition()
+    for row_marking in row_markings:
+        NonNegativeIntegerSemiring()(row_marking)
+    # build the levels from the top down, where each core of a level is visited only once
+    levels = [None] * len(row_markings) + [{end_core: []}]
+    for index in range(len(row_markings), 0, -1):
+        row_marking = row_markings[index - 1]
+        lower_level = {}
+        for core, children in levels[index].items():
+            for coveree in iter_k_marked_coverees(core, k, row_marking):
+                children.append(coveree)
+                lower_level[coveree] = []
+        levels[index - 1] = lower_level
+    # count the paths from the bottom up, dropping dead ends
+    counts = [dict((core, 1) for core in levels[0])]
+    for index in range(1, len(levels)):
+        level_counts = {}
+        for core, children in levels[index].items():
+            children[:] = [child for child in children if child in counts[index - 1]]
+            if children:
+                level_counts[core] = sum(counts[index - 1][child] for child in children)
+        counts.append(level_counts)
+    return levels, counts
+
+
+def end_core_to_num_marked_core_sequences(end_core, k, row_markings):
+    r"""
+    Return the number of core sequences marked by ``row_markings`` ending in ``end_core``.
+
+    The sequences are counted as paths in a DAG of cores, so they are never built.  See :meth:`end_core_to_marked_core_sequences` for the meaning of the inputs.
+
+    EXAMPLES::
+
+        sage: end_core_to_num_marked_core_sequences([5, 3, 1], 2, [1])
+        2
+        sage: end_core_to_num_marked_core_sequences([5, 3, 1], 2, [1, 2, 2])
+        0
+
+    ..  SEEALSO::
+
+        :meth:`end_core_to_marked_core_sequences`
+    """
+    levels, counts = _marked_core_sequence_dag(end_core, k, row_markings)
+    return sum(counts[-1].values())
+
+
+def iter_marked_core_sequences(end_core, k, row_markings):
+    r"""
+    Iterate over the core sequences marked by ``row_markings`` ending in ``end_core``.
+
+    Same as :meth:`end_core_to_marked_core_sequences`, except that the sequences are generated one at a time.  No recursion is used, so ``row_markings`` may be arbitrarily long.
+
+    EXAMPLES::
+
+        sage: sorted(iter_marked_core_sequences([5, 3, 1], 2, [1]))
+        [([3, 1, 1], [5, 3, 1]), ([4, 2], [5, 3, 1])]
+
+    ..  SEEALSO::
+
+        :meth:`end_core_to_marked_core_sequences`, :meth:`end_core_to_num_marked_core_sequences`
+    """
+    levels, counts = _marked_core_sequence_dag(end_core, k, row_markings)
+    # depth first search from the top of the DAG, where path[i] is the core chosen at level len(path) - 1 - i
+    top = len(levels) - 1
+    stack = [iter(counts[top])]
+    path = []
+    while stack:
+        core = next(stack[-1], None)
+        if core is None:
+            stack.pop()
+            if path:
+                path.pop()
+            continue
+        path.append(core)
+        level = top + 1 - len(path)
+        if level == 0:
+            yield tuple(reversed(path))
+            path.pop()
+        else:
+            stack.append(iter(levels[level][core]))
 
 
 def end_core_to_marked_core_sequences(end_core, k, row_markings):
@@ -417,29 +565,9 @@ def end_core_to_marked_core_sequences(end_core, k, row_markings):
 
     ..  SEEALSO::
 
-        :meth:`end_core_to_strong_marked_tableaux`
+        :meth:`iter_marked_core_sequences`, :meth:`end_core_to_num_marked_core_sequences`, :meth:`end_core_to_strong_marked_tableaux`
     """
-    # check inputs
-    k = NonNegativeIntegerSemiring()(k)
-    end_core = Core(end_core, k+1)
-    end_core = end_core.to_partition()
-    for row_marking in row_markings:
-        NonNegativeIntegerSemiring()(row_marking)
-    # find marked core sequences
-    sequences = []
-    if not row_markings:
-        # base case
-        sequences.append(tuple([end_core]))
-    else:
-        # inductive step
-        coverees = k_marked_coverees(end_core, k, row_markings[-1])
-        for coveree in coverees:
-            prefix_sequences = end_core_to_marked_core_sequences(
-                coveree, k, row_markings[:-1])
-            for prefix_sequence in prefix_sequences:
-                sequence = prefix_sequence + tuple([end_core])
-                sequences.append(sequence)
-    return set(sequences)
+    return set(iter_marked_core_sequences(end_core, k, row_markings))
 
 
 def end_core_to_strong_marked_tableaux(end_core, k, row_markings):
@@ -471,11 +599,211 @@ def end_core_to_strong_marked_tableaux(end_core, k, row_markings):
 
         :meth:`end_core_to_marked_core_sequences`
     """
-    core_sequences = end_core_to_marked_core_sequences(
-        end_core, k, row_markings)
-    smts = set()
-    for core_sequence in core_sequences:
+    return set(iter_strong_marked_tableaux(end_core, k, row_markings))
+
+
+def iter_strong_marked_tableaux(end_core, k, row_markings):
+    r"""
+    Iterate over the strong marked tableaux marked by ``row_markings`` ending in ``end_core``.
+
+    Same as :meth:`end_core_to_strong_marked_tableaux`, except that the tableaux are generated one at a time.
+
+    ..  SEEALSO::
+
+        :meth:`end_core_to_strong_marked_tableaux`, :meth:`iter_marked_core_sequences`
+    """
+    for core_sequence in iter_marked_core_sequences(end_core, k, row_markings):
         markings = row_markings_to_markings(core_sequence, row_markings)
-        smt = std_strong_tab_from_core_sequence(core_sequence, k, markings)
-        smts.add(smt)
-    return smts
+        yield std_strong_tab_from_core_sequence(core_sequence, k, markings)
+
+
+def _iter_all_marked_coverees(core, k):
+    # yield (row_marking, coveree) for every marked strong cover of the k+1-core ``core``
+    for row_marking in range(len(core)):
+        for coveree in iter_k_marked_coverees(core, k, row_marking):
+            yield row_marking, coveree
+
+
+def iter_standard_strong_marked_tableaux(core, k):
+    r"""
+    Iterate over all the standard strong marked tableaux of shape ``core``.
+
+    The marked strong covers are walked downward from ``core`` to the empty core depth first, so only the current path and one generator of marked covers per level are held in memory at once.  Every row marking of every cover is tried, which gives each standard strong marked tableau exactly once.
+
+    INPUTS:
+
+    - ``core`` -- a `k+1`-core
+
+    - ``k`` -- a nonnegative integer
+
+    EXAMPLES::
+
+        sage: list(iter_standard_strong_marked_tableaux([2], 2))
+        [[[-1, -2]]]
+        sage: len(list(iter_standard_strong_marked_tableaux([5, 3, 1], 2)))
+        30
+
+    ..  SEEALSO::
+
+        :meth:`count_standard_strong_marked_tableaux`, :meth:`iter_strong_marked_tableaux`
+    """
+    k = NonNegativeIntegerSemiring()(k)
+    core = Core(core, k+1).to_partition()
+    if not core:
+        yield std_strong_tab_from_core_sequence((core,), k, [])
+        return
+    # depth first search, where cores[i] is covered by cores[i-1] with the row marking row_markings[i]
+    cores = [core]
+    row_markings = [None]
+    stack = [_iter_all_marked_coverees(core, k)]
+    while stack:
+        marked_coveree = next(stack[-1], None)
+        if marked_coveree is None:
+            stack.pop()
+            cores.pop()
+            row_markings.pop()
+            continue
+        row_marking, coveree = marked_coveree
+        if coveree:
+            cores.append(coveree)
+            row_markings.append(row_marking)
+            stack.append(_iter_all_marked_coverees(coveree, k))
+        else:
+            core_sequence = (coveree,) + tuple(reversed(cores))
+            sequence_row_markings = [row_marking] + row_markings[:0:-1]
+            markings = row_markings_to_markings(core_sequence, sequence_row_markings)
+            yield std_strong_tab_from_core_sequence(core_sequence, k, markings)
+
+
+def count_standard_strong_marked_tableaux(core, k):
+    r"""
+    Return the number of standard strong marked tableaux of shape ``core``.
+
+    This counts the paths from ``core`` down to the empty core in the DAG of marked strong covers, where a cover marked in several rows is several edges.  The count is pushed down one level of the DAG at a time, so only the cores of a single level are held in memory, and no tableau is ever built.
+
+    EXAMPLES::
+
+        sage: count_standard_strong_marked_tableaux([2], 2)
+        1
+        sage: count_standard_strong_marked_tableaux([5, 3, 1], 2)
+        30
+
+    ..  SEEALSO::
+
+        :meth:`iter_standard_strong_marked_tableaux`, :meth:`end_core_to_num_marked_core_sequences`
+    """
+    k = NonNegativeIntegerSemiring()(k)
+    core = Core(core, k+1).to_partition()
+    counts = {core: 1}
+    for _ in range(abacus_k_size(k_core_to_abacus(core, k+1))):
+        lower_counts = {}
+        for upper_core, count in counts.items():
+            for row_marking, coveree in _iter_all_marked_coverees(upper_core, k):
+                lower_counts[coveree] = lower_counts.get(coveree, 0) + count
+        counts = lower_counts
+    return sum(counts.values())
+
+
+def strong_cover_spin(outer_core, inner_core, row_marking):
+    r""" Return the spin of the strong cover ``outer_core`` / ``inner_core`` marked in row ``row_marking``.
+
+    The skew shape of a strong cover is a union of `N` translates of a ribbon of height `h`.  Its spin is `N(h-1)` plus the number of those ribbons above the marked one, that is, the number of markings in rows above ``row_marking``.
+
+    EXAMPLES:
+
+    The skew shape [6, 4, 2, 2, 1] / [6, 3, 2, 2] is two ribbons of height `1`, with heads in rows `1` and `4`::
+
+        sage: strong_cover_spin([6, 4, 2, 2, 1], [6, 3, 2, 2], 1)
+        0
+        sage: strong_cover_spin([6, 4, 2, 2, 1], [6, 3, 2, 2], 4)
+        1
+
+    ..  SEEALSO::
+
+        :meth:`markings_by_row`, :meth:`spin_generating_polynomial`
+    """
+    markings = markings_by_row(outer_core, inner_core)
+    if row_marking not in markings:
+        raise ValueError('no such row marking')
+    return _strong_cover_spins(outer_core, inner_core, markings)[row_marking]
+
+
+def _strong_cover_spins(outer_core, inner_core, markings):
+    # map each row of ``markings`` (see :meth:`markings_by_row`) to the spin of the strong cover outer_core / inner_core marked in that row
+    num_ribbons = len(markings)
+    num_rows = sum(1 for r in range(len(outer_core))
+                   if (inner_core[r] if r < len(inner_core) else 0) < outer_core[r])
+    height = num_rows // num_ribbons
+    return dict((row_marking, num_ribbons * (height - 1) + num_above)
+                for num_above, row_marking in enumerate(sorted(markings)))
+
+
+def _iter_marked_strong_cover_edges(core, k):
+    # yield (coveree, marking content, spin) for every marked strong cover of the k+1-core ``core``
+    for coveree in k_coverees(core, k):
+        markings = markings_by_row(core, coveree)
+        spins = _strong_cover_spins(core, coveree, markings)
+        for row_marking, (row_index, col_index) in markings.items():
+            yield coveree, col_index - row_index, spins[row_marking]
+
+
+def spin_generating_polynomial(core, k, weight, base_ring=QQ['t'], t=None):
+    r"""
+    Return the sum of `t^{\text{spin}(T)}` over the strong marked tableaux `T` of shape ``core`` and weight ``weight``.
+
+    A strong marked tableau of weight `\mu` is a chain of marked strong covers from the empty core up to ``core``, cut into strong strips of lengths `\mu_1, \mu_2, \ldots`, where the contents of the markings strictly increase within each strip.  Its spin is the sum of the spins of its covers (see :meth:`strong_cover_spin`).
+
+    Each marked strong cover is an edge of the DAG of cores, labelled by the content of its marking and its spin.  The polynomial is pushed down this DAG one cover at a time, keeping for each core the content of the last marking of the current strip, so the cost grows with the number of edges rather than the number of tableaux.
+
+    INPUTS:
+
+    - ``core`` -- a `k+1`-core
+
+    - ``k`` -- a nonnegative integer
+
+    - ``weight`` -- a composition whose size is the `k`-size of ``core``
+
+    OPTIONAL INPUTS:
+
+    - ``base_ring`` -- (default ``QQ['t']``) the ring of the output
+
+    - ``t`` -- (default ``None``) the parameter, where ``None`` means the generator of ``base_ring``
+
+    EXAMPLES::
+
+        sage: spin_generating_polynomial([2, 1], 5, [1, 1, 1])
+        2
+        sage: spin_generating_polynomial([3, 1, 1], 2, [1, 1, 1, 1])
+        3*t + 3
+
+    ..  SEEALSO::
+
+        :meth:`count_standard_strong_marked_tableaux`, :meth:`strong_cover_spin`
+    """
+    k = NonNegativeIntegerSemiring()(k)
+    core = Core(core, k+1).to_partition()
+    weight = Composition(weight)
+    if t is None:
+        t = base_ring.gen()
+    if sum(weight) != abacus_k_size(k_core_to_abacus(core, k+1)):
+        return base_ring.zero()
+    # polynomials[(c, content)] sums t^spin over the marked chains from ``core`` down to c, where content is the content of the last marking in the current strip (None at the start of a strip)
+    polynomials = {(core, None): base_ring.one()}
+    for strip_length in reversed(weight):
+        for _ in range(strip_length):
+            lower_polynomials = {}
+            edges = {}
+            for (upper_core, bound), polynomial in polynomials.items():
+                if upper_core not in edges:
+                    edges[upper_core] = list(_iter_marked_strong_cover_edges(upper_core, k))
+                for coveree, content, spin in edges[upper_core]:
+                    if bound is None or content < bound:
+                        key = (coveree, content)
+                        lower_polynomials[key] = lower_polynomials.get(key, base_ring.zero()) + polynomial * t**spin
+            polynomials = lower_polynomials
+        strip_polynomials = {}
+        for (lower_core, bound), polynomial in polynomials.items():
+            key = (lower_core, None)
+            strip_polynomials[key] = strip_polynomials.get(key, base_ring.zero()) + polynomial
+        polynomials = strip_polynomials
+    return sum(polynomials.values(), base_ring.zero())
@@ -3,12 +3,14 @@
 # A place to test my functions
 # from __future__ import print_function
 import time
+from io import StringIO
 
 from sage.all import *
 print('Sage loaded.  Now loading local modules...')
 from testing import *
 from all import *
 from all import _is_sequence
+from all import _straighten_cache
 from strong_marked_tableau import __go_to_ribbon_head
 start_time = time.time()
 print('Modules loaded.  Testing...')
@@ -280,6 +282,13 @@ a(ri, [(0,2), (0,3), (0,4), (1,3), (1,4)])
 ri = selected_rows_to_maximum_root_ideal(5, [0, 1])
 a(ri, [(0,2), (0,3), (0,4), (1,3), (1,4), (2,4)])
 
+ri = selected_rows_to_maximum_root_ideal(5, [0, 1])
+a(ri.n, 5)
+
+# the bounce algorithm agrees with the removable roots algorithm
+for sp in [SkewPartition([[4, 2, 1, 1], [2, 1]]), SkewPartition([[6, 5, 3, 2, 2, 1], [2, 2]]), SkewPartition([[4, 3, 2, 2, 1, 1], [3, 2, 1, 1]])]:
+	a(RootIdeals().init_from_skew_partition(sp, algorithm='bounce'), RootIdeals().init_from_skew_partition(sp, algorithm='removable roots'))
+
 
 # test_removable_roots_to_partition
 rr = []
@@ -350,6 +359,16 @@ a(ri.down_path(4), [4])
 a(ri.down_path(5), [5])
 
 
+# test_up_path
+# Rightmost example 2.4 of SKEW-LINKED CATALAN FUNCTIONS AND k-SCHUR POSITIVITY
+ri = RootIdeal([(0,1), (0,2), (0,3), (0,4), (0,5), (1,4), (1,5), (2,4), (2,5), (3,4), (3,5)])
+a(ri.up(0), None)
+a(ri.up(4), 3)
+a(ri.up_path(5), [5, 3, 0])
+a(ri.top(4), 0)
+a(ri.bottom(2), 4)
+
+
 # test_down_path_column_lengths_part
 # Rightmost example 2.4 of SKEW-LINKED CATALAN FUNCTIONS AND k-SCHUR POSITIVITY
 ri = RootIdeal([(0,1), (0,2), (0,3), (0,4), (0,5), (1,4), (1,5), (2,4), (2,5), (3,4), (3,5)])
@@ -368,6 +387,18 @@ ri = RootIdeal([(0,1), (0,2), (0,3), (0,4), (0,5), (1,4), (1,5), (2,4), (2,5), (
 ptn = [7, 6, 5, 2, 2, 2]
 a(ri.down_path_column_lengths(ptn), [15, 7, 4, 2])
 
+ri = RIS.init_from_partition([3, 2, 1], 5)
+ptn = [5, 4, 3, 2, 1]
+a(ri.down_path_column_lengths(ptn), [9, 6])
+
+
+# test_down_path_column_lengths_many
+ri = RIS.init_from_partition([5, 2, 2, 2], 6)
+ptns = [[7, 6, 5, 2, 2, 2], [3, 3, 2, 1, 0, 0]]
+a(ri.down_path_column_lengths_many(ptns).tolist(), [[15, 7, 4, 2], [6, 2, 1, 0]])
+ri = RootIdeal([], n=3)
+a(ri.down_path_column_lengths_many([[3, 1, 1]]).tolist(), [[3, 1, 1]])
+
 
 # test_root_ideal_to_partition
 ri = RootIdeal([])
@@ -465,6 +496,18 @@ ptn = Partition([4, 4, 4, 3, 2])
 rs = k_row_lengths(ptn, 2)
 a(rs, [0, 1, 1, 1, 2])
 
+# test_k_profile
+ptn = Partition([4, 4, 4, 3, 2])
+profile = k_profile(ptn)
+a(len(profile), 9)
+for k in range(len(profile)):
+    a(profile[k]['k_size'], k_size(ptn, k))
+    a(profile[k]['k_row_lengths'], k_row_lengths(ptn, k))
+    a(profile[k]['k_column_lengths'], k_column_lengths(ptn, k))
+    a(profile[k]['is_k_shape'], is_k_shape(ptn, k))
+a(len(k_profile(ptn, k_max=12)), 13)
+a(k_profile([]), [{'k_size': 0, 'k_row_lengths': [], 'k_column_lengths': [], 'is_k_shape': True}])
+
 
 # test_has_rectangle
 p = Partition([1, 1, 1])
@@ -644,6 +687,15 @@ correct_ris = [
 a(set(RIS.init_all_from_skew_partition(sp)), set(correct_ris))
 
 
+# test_RIS.iter_all_from_skew_partition and count_all_from_skew_partition
+sp = SkewPartition([[4, 2, 1, 1], [2, 1]])
+a(list(RIS.iter_all_from_skew_partition(sp)), RIS.init_all_from_skew_partition(sp))
+a(RIS.count_all_from_skew_partition(sp), 2)
+sp = SkewPartition([[6, 5, 3, 2, 2, 1], [2, 2]])
+a(RIS.count_all_from_skew_partition(sp), len(RIS.init_all_from_skew_partition(sp)))
+a(RIS.count_all_from_skew_partition(sp, type=None), len(RIS.init_all_from_skew_partition(sp, type=None)))
+
+
 # test_get_k_rectangles
 out = set(get_k_rectangles(0))
 a(out, set(Partition([])))
@@ -836,6 +888,14 @@ a(ptns, [[]])
 ptns = k_to_irreducible_k_shapes(3)
 a(ptns, [[], [1], [2, 1]])
 
+a(k_to_irreducible_k_shapes(4), k_to_irreducible_k_shapes(4, algorithm='brute force'))
+a(sorted(iter_irreducible_k_shapes(3)), [[], [1], [2, 1]])
+
+
+# test_k_to_num_irreducible_k_shapes
+# Genocchi numbers
+a([k_to_num_irreducible_k_shapes(k) for k in range(1, 7)], [1, 1, 3, 17, 155, 2073])
+
 
 # test is k core, now using builtin is core
 a(Partition([2, 1]).is_core(1), False)
@@ -953,6 +1013,55 @@ ri = RootIdeal([(0,1), (1,2), (3,4)], n=5)
 a(ri.complement(), [(0,2), (0,3), (0,4), (1,3), (1,4), (2,3), (2,4)])
 
 
+# test_root_ideal_membership
+ri = RootIdeal([(0,4), (0,5), (0,6), (1,6)])
+a((0, 5) in ri, True)
+a((1, 5) in ri, False)
+a((7, 0) in ri, False)
+ri = RootIdeal([(0,1), (0,3)], n=4)
+a((0, 2) in ri, False)
+a((0, 3) in ri, True)
+
+
+# test_root_ideal_mutation
+ri = RootIdeal([(0,2), (0,3), (1,3)])
+a(ri.down(1), 3)
+ri.append((1,2))
+a((1, 2) in ri, True)
+a(ri.down(1), 2)
+a(hash(ri) == hash(RootIdeal([(0,2), (0,3), (1,2), (1,3)])), True)
+ri.remove((0,2))
+a((0, 2) in ri, False)
+a(ri.down(0), 3)
+ri += [(0,5)]
+a(ri.n, 6)
+a((0, 5) in ri, True)
+
+
+# test_removable_roots and test_addable_roots
+ri = RootIdeal([(0,1), (0,2), (1,2), (0,3), (1,3)], 4)
+a(ri.removable_roots(), {(0,1), (1,2)})
+a(ri.addable_roots(), {(2,3)})
+ri = RootIdeal([(0,2), (0,3), (1,3)], 4)
+a(ri.addable_roots(), {(0,1), (1,2), (2,3)})
+ri = RootIdeal([], 3)
+a(ri.removable_roots(), set())
+a(ri.addable_roots(), {(0,2)})
+
+
+# test_meet, test_join, test_contains and test_covers
+ri1 = RIS.init_from_partition([3, 1], 5)
+ri2 = RIS.init_from_partition([2, 2, 1], 5)
+a(ri1.meet(ri2), RIS.init_from_partition([2, 1], 5))
+a(ri1.join(ri2), RIS.init_from_partition([3, 2, 1], 5))
+a(ri1.contains(ri1.meet(ri2)), True)
+a(ri1.contains(ri2), False)
+a(ri1.join(ri2).contains(ri2.freeze()), True)
+a(ri1.covers(RIS.init_from_partition([2, 1], 5)), True)
+a(ri1.covers(RIS.init_from_partition([2], 5)), False)
+a(ri1.covers(ri1), False)
+
+
 # test_partition_to_k_schur_root_ideal
 p = [2, 1]
 n = 4
@@ -997,6 +1106,19 @@ a(compositional_hall_littlewood_Qp([0, 4]), t**2 * HLQp[2, 2] + t**2 * HLQp[3, 1
 # length 3 composition
 a(compositional_hall_littlewood_Qp([1, 3, 2]), t * HLQp[2, 2, 2] + t**2 * HLQp[3, 2, 1] - HLQp[2, 2, 2])
 
+# test compositional hall littlewood Qp many
+gammas = [[1, 3, 2], [0, 4], [3, 3, 2], [2, 3, 2], [0, 1, 3, 2], [4, 0], []]
+a(compositional_hall_littlewood_Qp_many(gammas), [compositional_hall_littlewood_Qp(gamma) for gamma in gammas])
+
+
+# test symmetric function bases
+bases = symmetric_function_bases(QQ['t'])
+a(bases is symmetric_function_bases(QQ['t']), True)
+a(bases.s, SymmetricFunctions(QQ['t']).s())
+a(bases.Qp, SymmetricFunctions(QQ['t']).hall_littlewood().Qp())
+a(symmetric_function_bases(QQ['t'], t=1).Qp, SymmetricFunctions(QQ['t']).hall_littlewood(t=1).Qp())
+a(symmetric_function_bases(QQ).h, SymmetricFunctions(QQ).h())
+
 
 # test_straighten
 Sym = SymmetricFunctions(QQ)
@@ -1017,6 +1139,17 @@ t = base_ring.gen()
 hl = Sym.hall_littlewood().Qp()
 a(straighten(hl, [3, 0, 1]), t*hl[3, 1])
 
+# test straighten many
+Sym = SymmetricFunctions(QQ)
+s = Sym.s()
+a(straighten_many(s, [[2, 1, 3], [1, 2], [3, 1]]), [-s[2, 2, 2], 0, s[3, 1]])
+# enough compositions of the same length to go through numpy
+compositions = [[a1, a2, a3] for a1 in range(-1, 5) for a2 in range(-1, 5) for a3 in range(-1, 5)]
+for basis in (Sym.s(), Sym.h(), Sym.e()):
+    expected = [straighten(basis, composition) for composition in compositions]
+    _straighten_cache.clear()
+    a(straighten_many(basis, compositions), expected)
+
 
 # seq space
 S = ShiftingSequenceSpace()
@@ -1089,6 +1222,14 @@ a(R[(3, 2, 2)]((s[4, 4], s[1], s[2, 1])), (s[7, 6, 2], s[4, 2, 2], s[5, 3, 2]))
 # act on things added together
 s = Sym.s()
 a(R[(1, -1)](s[2, 1] + s[3, 1]), s[3] + s[4])
+# terms which cancel before straightening
+a(((1 - R[(1, -1)]) * (1 + R[(1, -1)]))(s[2, 1] + s[1, 1]), s[2, 1] + s[1, 1])
+a(((1 - R[(1, -1)]) * (1 + R[(1, -1)]))(hl[2, 1] + 2*hl[1, 1]), hl[2, 1] + 2*hl[1, 1])
+# the coefficients of the operator are coerced into the base ring of the operand
+s_QQ = SymmetricFunctions(QQ).s()
+out = R[(1, -1)](s_QQ[2, 1] + s_QQ[1, 1])
+a(out, s_QQ[3] + s_QQ[2])
+a(all(coeff.parent() is QQ for coeff in out.monomial_coefficients().values()), True)
 
 
 # test RaisingOperatorAlgebra
@@ -1145,6 +1286,11 @@ H = HallLittlewoodVertexOperator
 gamma = [g1, g2, g3]
 one = hl.one()
 a(H(gamma)(one), H(g1)(H(g2)(H(g3)(one))))
+# _op skews in one pass, which should agree with skewing by each e[k](1-t) separately
+op = H(gamma)
+f = Sym.s()[2, 1] + 3*Sym.s()[1] + Sym.s()[3, 2]
+for m in (-2, -1, 0, 2):
+    a(op._op(m, f), sum((-1)**k * op._hh(m+k) * op._skewbyeeq(k, f) for k in range(f.degree() + 1)))
 
 
 # test qt raising roots operator
@@ -1155,6 +1301,20 @@ op = qt_raising_roots_operator(3)
 a(op(s[4, 2]), s[4, 2] + (-t-q)*s[5, 1] + t*q*s[6])
 
 
+# test apply raising roots operator
+a(apply_raising_roots_operator([(0, 1)], [2, 1]), [([2, 1], 1), ([3, 0], -1)])
+base_ring = QQ['t']
+t = base_ring.gen()
+sym = SymmetricFunctions(base_ring)
+for basis in (sym.s(), sym.h(), sym.hall_littlewood().Qp()):
+    f = basis[4, 2, 1] + basis[3, 3]
+    a(apply_raising_roots_operator(3, f, t=t), raising_roots_operator(3, t=t)(f))
+    a(apply_raising_roots_operator([(0, 2), (1, 2)], f), raising_roots_operator([(0, 2), (1, 2)])(f))
+# a basis with no straightening rule
+m = SymmetricFunctions(QQ).m()
+a(apply_raising_roots_operator([(0, 1)], [2, 1], basis=m), m[2, 1] - m[3])
+
+
 # test catalan function init methods
 CFS = CatalanFunctions()
 
@@ -1260,6 +1420,76 @@ a(RIS.init_parabolic_from_composition(Partition([1, 1])), [(0, 1)])
 a(RIS.init_parabolic_from_composition(Composition([1, 1])), [(0, 1)])
 
 
+# test dyck words of root ideals
+a(list(iter_dyck_words(3)), [0b101010, 0b101100, 0b110010, 0b110100, 0b111000])
+a(len(list(iter_dyck_words(6))), catalan_number(6))
+a([dyck_word_rank(word) for word in iter_dyck_words(5)], list(range(catalan_number(5))))
+a([dyck_word_unrank(rank, 5) for rank in range(catalan_number(5))], list(iter_dyck_words(5)))
+a(RIS.init_staircase(4).to_dyck_word(), 0b10101010)
+a(RootIdeal([], n=4).to_dyck_word(), 0b11110000)
+a(RIS.init_from_dyck_word(0b11011000), [(0, 2), (0, 3)])
+ri = RIS.init_from_partition([5, 2, 2, 2], 6)
+a(RIS.init_from_dyck_word(ri.to_dyck_word()), ri)
+a(RIS.init_from_dyck_word(dyck_word_unrank(dyck_word_rank(ri.to_dyck_word()), 6)), ri)
+# words with extra bits are rejected
+for word, n in [(0b110, None), (0b1110, None), (0b11010, 2)]:
+	try:
+		dyck_word_rank(word, n)
+		a(True, False)
+	except ValueError:
+		pass
+
+
+# test frozen root ideals
+FRIS = RootIdeals(frozen=True)
+ri = RIS.init_from_partition([5, 2, 2, 2], 6)
+fri = FRIS.init_from_partition([5, 2, 2, 2], 6)
+a(isinstance(fri, FrozenRootIdeal), True)
+a(fri == ri and ri == fri, True)
+a(hash(fri), hash(ri))
+a(hash(ri.freeze()), hash(fri))
+a({fri: 1}[ri], 1)
+a((1, 4) in fri, True)
+a((1, 3) in fri, False)
+a(fri.down_path_column_lengths([7, 6, 5, 2, 2, 2]), [15, 7, 4, 2])
+a(fri.to_partition(), [5, 2, 2, 2])
+a(FrozenRootIdeal([], n=3) == FrozenRootIdeal([], n=5), True)
+a(FRIS.init_parabolic_from_composition([1, 2]), [(0, 1), (0, 2)])
+a(isinstance(FRIS.init_staircase(4), FrozenRootIdeal), True)
+sp = SkewPartition([[6, 5, 3, 2, 2, 1], [2, 2]])
+for algorithm in ['removable roots', 'bounce']:
+	fri_sp = FRIS.init_from_skew_partition(sp, algorithm=algorithm)
+	a(isinstance(fri_sp, FrozenRootIdeal), True)
+	a(fri_sp.n, 6)
+	a(fri_sp, [(0,3), (0,4), (0,5), (1,4), (1,5)])
+	a(RIS.init_from_skew_partition(sp, algorithm=algorithm).n, 6)
+a(fri.thaw() == ri and isinstance(fri.thaw(), RootIdeal), True)
+a(hasattr(fri, 'append'), False)
+
+
+# test root vector matrices
+ri = RootIdeal([(0,2), (0,3), (1,3)])
+a(ri.root_vector_matrix(), matrix(ZZ, [[1, 0, -1, 0], [1, 0, 0, -1], [0, 1, 0, -1]]))
+a(ri.root_vector_matrix().is_sparse(), True)
+data, indices, indptr = ri.root_vector_matrix(format='numpy')
+a((data.tolist(), indices.tolist(), indptr.tolist()), ([1, -1, 1, -1, 1, -1], [0, 2, 0, 3, 1, 3], [0, 2, 4, 6]))
+ris = [RootIdeal([(0,1)], n=3), RootIdeal([(0,2), (1,2)])]
+a(root_ideals_to_root_vector_matrix(ris), matrix(ZZ, [[1, -1, 0], [1, 0, -1], [0, 1, -1]]))
+a(root_ideals_to_root_vector_matrix([], n=2).dimensions(), (0, 2))
+
+
+# test drawing many root ideals
+sink = StringIO()
+write_root_ideal_diagrams([RootIdeal([(0,1)]), CatalanFunction([(0,2)], [3,2,1])], sink)
+a(sink.getvalue().count('\\begin{ytableau}'), 2)
+a(sink.getvalue().startswith('\\documentclass{article}'), True)
+a(str(latex(CatalanFunction([(0,2)], [3,2,1]))) in sink.getvalue(), True)
+sink = StringIO()
+write_root_ideal_diagrams([RootIdeal([(0,1)]), RootIdeal([(0,2)], 3)], sink, format='svg')
+a(sink.getvalue().count('<rect'), 4 + 9)
+a(sink.getvalue().count('fill="red"'), 2)
+
+
 # test bottom for root ideal
 ri = RIS.init_from_partition([3, 2, 1], 5)
 a(ri.bottom(0), 4)
@@ -1367,6 +1597,30 @@ a(k_coverees([2, 1, 1], 2), set([Partition([2]), Partition([1, 1])]))
 
 a(k_coverees([6, 4, 2, 2, 1], 5), set([Partition([5, 4, 2, 2, 1]), Partition([6, 2, 2, 2, 1]), Partition([6, 3, 2, 2]), Partition([6, 4, 2, 1, 1])]))
 
+for algorithm in (1, 2):
+    a(k_coverees([6, 4, 2, 2, 1], 5, algorithm=algorithm), k_coverees([6, 4, 2, 2, 1], 5, algorithm=3))
+for core in Cores(4, 12):
+    a(k_coverees(core, 3, algorithm=3), k_coverees(core, 3, algorithm=2))
+
+
+# test is k core
+a(is_k_core(Partition([2, 1]), 2), True)
+a(is_k_core(Partition([2, 1]), 3), False)
+a(is_k_core(Partition([]), 1), True)
+a([ptn for ptn in Partitions(8) if is_k_core(ptn, 3)], [ptn for ptn in Partitions(8) if ptn.is_core(3)])
+
+
+# test abacus
+for core in Cores(3, 10):
+    ptn = core.to_partition()
+    abacus = k_core_to_abacus(ptn, 3)
+    a(sum(abacus), 0)
+    a(abacus_to_k_core(abacus), ptn)
+    a(abacus_k_size(abacus), k_size(ptn, 2))
+a(k_core_to_abacus([3, 1], 3), [0, -1, 1])
+abacus = k_core_to_abacus([6, 4, 2, 2, 1], 6)
+a(sorted(abacus_to_k_core(ab) for ab in abacus_marked_strong_down_list(abacus, 2, 1)), [[6, 2, 2, 2, 1], [6, 3, 2, 2]])
+
 
 # test go to ribbon head
 a(__go_to_ribbon_head([(0,1)], (0,1)), (0,1))
@@ -1413,6 +1667,14 @@ a(is_row_markable([3, 3, 2, 2], [2, 2, 1, 1], 2), True)
 a(is_row_markable([3, 3, 2, 2], [2, 2, 1, 1], 3), False)
 
 
+# test markings by row
+a(markings_by_row([3, 2, 2], [2, 1]), {0: (0,2), 1: (1,1)})
+a(markings_by_row([3, 2, 2], [1, 1]), {0: (0,2)})
+a(markings_by_row([3, 3, 2, 2], [2, 2, 1, 1]), {0: (0,2), 2: (2,1)})
+a(markings_by_row([1], []), {0: (0,0)})
+a(markings_by_row([2, 1], [2, 1]), {})
+
+
 # test k marked coverees
 # a(k_coverees([6, 4, 2, 2, 1], 5), set([Partition([5, 4, 2, 2, 1]), Partition([6, 2, 2, 2, 1]), Partition([6, 3, 2, 2]), Partition([6, 4, 2, 1, 1])]))
 a(k_marked_coverees([6, 4, 2, 2, 1], 5, 0), set([Partition([5, 4, 2, 2, 1])]))
@@ -1420,6 +1682,11 @@ a(k_marked_coverees([6, 4, 2, 2, 1], 5, 1), set([Partition([6, 2, 2, 2, 1]), Par
 a(k_marked_coverees([6, 4, 2, 2, 1], 5, 2), set())
 a(k_marked_coverees([6, 4, 2, 2, 1], 5, 3), set([Partition([6, 4, 2, 1, 1])]))
 a(k_marked_coverees([6, 4, 2, 2, 1], 5, 4), set([Partition([6, 3, 2, 2])]))
+a(list(iter_k_marked_coverees([6, 4, 2, 2, 1], 5, 5)), [])
+for core in Cores(3, 8):
+    ptn = core.to_partition()
+    for row_marking in range(len(ptn)):
+        a(k_marked_coverees(ptn, 2, row_marking), set(c for c in k_coverees(ptn, 2) if is_row_markable(ptn, c, row_marking)))
 
 
 # test end core to marked core sequences
@@ -1461,6 +1728,16 @@ a(end_core_to_marked_core_sequences([5, 3, 1], 2, [0, 1, 1, 2]),
 	]))
 a(end_core_to_marked_core_sequences([5, 3, 1], 2, [1, 2, 2]), set())
 
+# test end core to num marked core sequences
+a(end_core_to_num_marked_core_sequences([5, 3, 1], 2, [0, 1, 2, 0, 1]), 1)
+a(end_core_to_num_marked_core_sequences([5, 3, 1], 2, [1]), 2)
+a(end_core_to_num_marked_core_sequences([5, 3, 1], 2, [1, 2, 2]), 0)
+a(end_core_to_num_marked_core_sequences([5, 3, 1], 2, []), 1)
+
+# test iter marked core sequences
+a(set(iter_marked_core_sequences([5, 3, 1], 2, [0, 1])), end_core_to_marked_core_sequences([5, 3, 1], 2, [0, 1]))
+a(list(iter_marked_core_sequences([5, 3, 1], 2, [])), [(Partition([5, 3, 1]),)])
+
 
 # test std_strong_tab_from_core_sequence(core_sequence, k, marks):
 cs = [[], [1]]
@@ -1481,6 +1758,12 @@ marks = [(0,0), (0,1), (1,0), (0,2)]
 st = std_strong_tab_from_core_sequence(cs, k, marks)
 a(st, StrongTableau([[-1, -2, -4], [-3]], k))
 
+cs = [[1], [2], [2, 1]]
+k = 4
+marks = [(0,1), (1,0)]
+st = std_strong_tab_from_core_sequence(cs, k, marks)
+a(st, StrongTableau([[None, -1], [-2]], k))
+
 
 # test end core to strong marked tableaux
 a(end_core_to_strong_marked_tableaux([5, 3, 1], 2, [0, 1, 2, 0, 1]),
@@ -1492,6 +1775,28 @@ a(end_core_to_strong_marked_tableaux([5, 3, 1], 2, [1]),
 	]))
 
 
+# test standard strong marked tableaux
+a(list(iter_standard_strong_marked_tableaux([2], 2)), [StrongTableau([[-1, -2]], 2)])
+a(count_standard_strong_marked_tableaux([], 2), 1)
+smts = set(iter_standard_strong_marked_tableaux([5, 3, 1], 2))
+a(len(smts), 30)
+a(count_standard_strong_marked_tableaux([5, 3, 1], 2), 30)
+a(StrongTableau([[-1, 3, -4, 5, 5], [-2, 5, -5], [-3]], 2) in smts, True)
+
+
+# test spin generating polynomial
+a(strong_cover_spin([6, 4, 2, 2, 1], [6, 3, 2, 2], 1), 0)
+a(strong_cover_spin([6, 4, 2, 2, 1], [6, 3, 2, 2], 4), 1)
+a(strong_cover_spin([2, 1, 1], [2], 1), 1)
+t = QQ['t'].gen()
+a(spin_generating_polynomial([2, 1], 5, [1, 1, 1]), 2)
+a(spin_generating_polynomial([3, 1, 1], 2, [1, 1, 1, 1]), 3*t + 3)
+a(spin_generating_polynomial([3, 1, 1], 2, [2, 2]), t)
+a(spin_generating_polynomial([2, 1, 1], 2, [3]), 0)
+a(spin_generating_polynomial([5, 3, 1], 2, [1, 1, 1, 1, 1])(1), count_standard_strong_marked_tableaux([5, 3, 1], 2))
+a(spin_generating_polynomial([4, 2], 2, [2, 2], t=2), 7)
+
+
 # test ungraded
 # setup
 base_ring = ZZ['t']